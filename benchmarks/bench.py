@@ -0,0 +1,142 @@
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.complexity import fit_complexity
+from benchmarks.generators import BASE_SIZES, GENERATORS, write_input
+from solutions.runner import Solver, select_solvers
+from util import cache
+from util.file_util import clear_input_sources, get_input_file_path, set_input_source
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+REAL_FILE_ID = 1
+
+
+def get_solver_key(solver: Solver) -> str:
+    return f"{solver.level}/{'+'.join(map(str, solver.parts))}"
+
+
+def time_solver(solver: Solver, repeat: int) -> float:
+    best_time = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        solver.function()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+
+def benchmark_real_input(solver: Solver, repeat: int) -> Dict[str, Any]:
+    path = get_input_file_path(solver.level, REAL_FILE_ID)
+    set_input_source(solver.level, path)
+    try:
+        return {"size": path.stat().st_size, "time": time_solver(solver, repeat)}
+    finally:
+        clear_input_sources()
+
+
+def write_scaled_input(level: int, factor: int, directory: Path) -> Path:
+    path = directory / f"level{level}-x{factor}.txt"
+    write_input(level, BASE_SIZES[level] * factor, path, seed=level)
+    return path
+
+
+def benchmark_scales(solver: Solver, scales: List[int], repeat: int, max_seconds: float) -> Dict[str, Any]:
+    measurements: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for factor in sorted(scales):
+            path = write_scaled_input(solver.level, factor, Path(directory))
+            set_input_source(solver.level, path)
+            try:
+                elapsed = time_solver(solver, repeat)
+            finally:
+                clear_input_sources()
+            measurements[str(factor)] = {"size": path.stat().st_size, "time": elapsed}
+            if elapsed > max_seconds:  # the next scale would take far too long
+                break
+    return measurements
+
+
+def benchmark(solvers: List[Solver], scales: List[int], repeat: int, max_seconds: float) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for solver in solvers:
+        key = get_solver_key(solver)
+        print(f"Benchmarking level {key}", file=sys.stderr, flush=True)
+        result: Dict[str, Any] = {"real": benchmark_real_input(solver, repeat)}
+        if solver.level in GENERATORS and scales:
+            result["scales"] = benchmark_scales(solver, scales, repeat, max_seconds)
+            if len(result["scales"]) > 1:
+                sizes = [measurement["size"] for measurement in result["scales"].values()]
+                times = [measurement["time"] for measurement in result["scales"].values()]
+                result["complexity"] = fit_complexity(sizes, times)
+        results[key] = result
+    return results
+
+
+def get_timings(result: Dict[str, Any]) -> Dict[str, float]:
+    timings = {"real": result["real"]["time"]}
+    for factor, measurement in result.get("scales", {}).items():
+        timings[f"x{factor}"] = measurement["time"]
+    return timings
+
+
+def find_regressions(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_delta: float
+) -> List[str]:
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        baseline_timings = get_timings(baseline[key])
+        for name, elapsed in get_timings(result).items():
+            if name not in baseline_timings:
+                continue
+            baseline_time = baseline_timings[name]
+            if elapsed > baseline_time * (1 + threshold) and elapsed - baseline_time > min_delta:
+                regressions.append(f"Level {key} ({name}): {baseline_time:.4f}s -> {elapsed:.4f}s")
+    return regressions
+
+
+def parse_arguments(arguments: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark Advent of Code 2022 levels")
+    parser.add_argument("levels", type=int, nargs="*", help="levels to benchmark, all if omitted")
+    parser.add_argument("-s", "--scales", type=int, nargs="*", default=[1, 10, 100], help="synthetic input scales")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per measurement, the fastest counts")
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="stop scaling a level after a slower run")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument("--min-delta", type=float, default=0.01, help="ignore slowdowns below these seconds")
+    parser.add_argument("-o", "--output", type=Path, help="write the results to this JSON file")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: List[str] | None = None) -> int:
+    args = parse_arguments(arguments)
+    cache.CACHE_ENABLED = False  # a cache hit would only measure unpickling
+    solvers = select_solvers(args.levels, [])
+    results = benchmark(solvers, args.scales, args.repeat, args.max_seconds)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.update_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2))
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline first", file=sys.stderr)
+        return 0
+
+    regressions = find_regressions(results, json.loads(args.baseline.read_text()), args.threshold, args.min_delta)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
@@ -0,0 +1,43 @@
+import math
+from typing import Callable, Dict, List, Tuple
+
+COMPLEXITY_MODELS: Dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: n ** 2,
+    "O(n^3)": lambda n: n ** 3,
+}
+
+
+def fit_exponent(sizes: List[float], times: List[float]) -> float:
+    # slope of the least squares line through log(time) over log(size)
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(time, 1e-9)) for time in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def fit_model(sizes: List[float], times: List[float], model: Callable[[float], float]) -> Tuple[float, float]:
+    # fits time = factor * model(size), the error is relative so small and large inputs count the same
+    values = [model(size) for size in sizes]
+    factor = sum(time / value for time, value in zip(times, values)) / len(values)
+    error = sum((factor * value / time - 1) ** 2 for time, value in zip(times, values) if time > 0)
+    return factor, error
+
+
+def fit_complexity(sizes: List[float], times: List[float]) -> Dict[str, float | str]:
+    if len(sizes) < 2:
+        raise ValueError("Need at least two measurements to fit a complexity")
+
+    best_model, best_factor, best_error = "", 0.0, math.inf
+    for name, model in COMPLEXITY_MODELS.items():
+        factor, error = fit_model(sizes, times, model)
+        if error < best_error:
+            best_model, best_factor, best_error = name, factor, error
+    return {"model": best_model, "factor": best_factor, "exponent": fit_exponent(sizes, times)}
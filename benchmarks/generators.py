@@ -0,0 +1,502 @@
+import argparse
+import math
+import operator
+import string
+from pathlib import Path
+from random import Random
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from util.file_util import open_output_file
+
+# Every generator yields the lines of a valid input. The size is roughly the number of records,
+# for grid levels it is the number of cells.
+Generator = Callable[[int, Random], Iterator[str]]
+
+LETTERS = string.ascii_lowercase + string.ascii_uppercase
+SNAFU_DIGITS = "=-012"
+
+
+def get_name(index: int, length: int, alphabet: str = string.ascii_lowercase) -> str:
+    name = ""
+    for _ in range(length):
+        index, digit = divmod(index, len(alphabet))
+        name = alphabet[digit] + name
+    return name
+
+
+def get_side(size: int, minimum: int = 4) -> int:
+    return max(minimum, math.isqrt(size))
+
+
+def generate_level1(size: int, random: Random) -> Iterator[str]:
+    for i in range(size):
+        if i > 0:
+            yield ""
+        for _ in range(random.randint(1, 15)):
+            yield str(random.randint(1000, 60000))
+
+
+def generate_level2(size: int, random: Random) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{random.choice('ABC')} {random.choice('XYZ')}"
+
+
+def generate_rucksack(letters: List[str], badge: str, random: Random) -> str:
+    wrong_item = random.choice(letters + [badge])
+    others = [letter for letter in letters + [badge] if letter != wrong_item]
+    random.shuffle(others)
+    split = random.randint(0, len(others))
+    compartment1, compartment2 = [wrong_item] + others[:split], [wrong_item] + others[split:]
+    # compartments must have the same length, repeat items within a compartment to pad
+    while len(compartment1) < len(compartment2):
+        compartment1.append(random.choice(compartment1))
+    while len(compartment2) < len(compartment1):
+        compartment2.append(random.choice(compartment2))
+    random.shuffle(compartment1)
+    random.shuffle(compartment2)
+    return "".join(compartment1) + "".join(compartment2)
+
+
+def generate_level3(size: int, random: Random) -> Iterator[str]:
+    for _ in range(max(1, size // 3)):
+        badge = random.choice(LETTERS)
+        # every other letter is left out of at least one rucksack, so only the badge is shared by all
+        letters: List[List[str]] = [[], [], []]
+        for letter in random.sample(LETTERS, 30):
+            if letter == badge:
+                continue
+            excluded = random.randrange(3)
+            for i in range(3):
+                if i != excluded and random.random() < 0.5:
+                    letters[i].append(letter)
+        for i in range(3):
+            yield generate_rucksack(letters[i], badge, random)
+
+
+def generate_range(random: Random, limit: int) -> Tuple[int, int]:
+    start = random.randint(1, limit)
+    return start, random.randint(start, limit)
+
+
+def generate_level4(size: int, random: Random) -> Iterator[str]:
+    for _ in range(size):
+        (start1, end1), (start2, end2) = generate_range(random, 99), generate_range(random, 99)
+        yield f"{start1}-{end1},{start2}-{end2}"
+
+
+def generate_level5(size: int, random: Random) -> Iterator[str]:
+    num_stacks = 9
+    stacks = [[random.choice(string.ascii_uppercase) for _ in range(random.randint(2, 8))] for _ in range(num_stacks)]
+    for height in range(max(map(len, stacks)) - 1, -1, -1):
+        yield " ".join(f"[{stack[height]}]" if height < len(stack) else "   " for stack in stacks)
+    yield " ".join(f" {i + 1} " for i in range(num_stacks))
+    yield ""
+
+    # only the sizes matter for valid commands, every stack keeps at least one crate
+    sizes = list(map(len, stacks))
+    for _ in range(size):
+        move_from = random.choice([i for i in range(num_stacks) if sizes[i] > 1])
+        move_to = random.choice([i for i in range(num_stacks) if i != move_from])
+        amount = random.randint(1, min(sizes[move_from] - 1, 20))
+        sizes[move_from] -= amount
+        sizes[move_to] += amount
+        yield f"move {amount} from {move_from + 1} to {move_to + 1}"
+
+
+def generate_level6(size: int, random: Random) -> Iterator[str]:
+    # Two letters can't form a marker and every window that reaches back into the body holds both d, so the
+    # start-of-packet marker ends at the g and the start-of-message marker at the very end
+    body = "".join(random.choice("ab") for _ in range(max(0, size - 15)))
+    yield body + "ddefghijklmnopq"
+
+
+def generate_level7(size: int, random: Random) -> Iterator[str]:
+    yield "$ cd /"
+    remaining = size
+    todo: List[Tuple[str, int]] = [("/", 0)]
+    while todo:
+        name, depth = todo.pop()
+        if name == "..":
+            yield "$ cd .."
+            continue
+        if name != "/":
+            yield f"$ cd {name}"
+
+        yield "$ ls"
+        num_entries = random.randint(1, 10)
+        remaining -= num_entries
+        directories = []
+        for i in range(num_entries):
+            # the last entry becomes a directory when no other did, so the tree keeps growing until it has size entries
+            is_last_chance = i == num_entries - 1 and not directories
+            if remaining > 0 and depth < 200 and (random.random() < 0.3 or is_last_chance):
+                directories.append(f"d{i}")
+                yield f"dir d{i}"
+            else:
+                yield f"{random.randint(1, 300000)} f{i}.{random.choice(['txt', 'dat', 'log'])}"
+
+        for directory in reversed(directories):
+            todo.append(("..", depth))
+            todo.append((directory, depth + 1))
+
+
+def generate_level8(size: int, random: Random) -> Iterator[str]:
+    side = get_side(size)
+    for _ in range(side):
+        yield "".join(random.choice(string.digits) for _ in range(side))
+
+
+def generate_level9(size: int, random: Random) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{random.choice('UDLR')} {random.randint(1, 20)}"
+
+
+def generate_level10(size: int, random: Random) -> Iterator[str]:
+    # the screen needs at least 240 cycles
+    for _ in range(max(size, 240)):
+        if random.random() < 0.4:
+            yield "noop"
+        else:
+            yield f"addx {random.randint(-10, 10)}"
+
+
+def generate_level11(size: int, random: Random) -> Iterator[str]:
+    # ids are read as a single digit
+    num_monkeys = 8
+    primes = random.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], num_monkeys)
+    for i in range(num_monkeys):
+        if i > 0:
+            yield ""
+        items = [str(random.randint(50, 99)) for _ in range(max(1, size // num_monkeys))]
+        operation = random.choice([f"old * {random.randint(2, 19)}", f"old + {random.randint(1, 8)}", "old * old"])
+        targets = random.sample([monkey for monkey in range(num_monkeys) if monkey != i], 2)
+        yield f"Monkey {i}:"
+        yield f"  Starting items: {', '.join(items)}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {primes[i]}"
+        yield f"    If true: throw to monkey {targets[0]}"
+        yield f"    If false: throw to monkey {targets[1]}"
+
+
+def generate_level12(size: int, random: Random) -> Iterator[str]:
+    # the height rises by at most one per step towards E, so E is always reachable
+    side = get_side(size, 14)
+    for y in range(side):
+        line = ""
+        for x in range(side):
+            if x == 0 and y == 0:
+                line += "S"
+            elif x == side - 1 and y == side - 1:
+                line += "E"
+            else:
+                height = (x + y) * 25 // (2 * side - 2)
+                if random.random() < 0.2:
+                    height = max(0, height - random.randint(1, 3))
+                line += chr(ord("a") + height)
+        yield line
+
+
+def generate_level13(size: int, random: Random) -> Iterator[str]:
+    def packet(depth: int) -> str:
+        items = []
+        for _ in range(random.randint(0, 4)):
+            if depth < 4 and random.random() < 0.3:
+                items.append(packet(depth + 1))
+            else:
+                items.append(str(random.randint(0, 10)))
+        return "[" + ",".join(items) + "]"
+
+    for i in range(size):
+        if i > 0:
+            yield ""
+        yield packet(0)
+        yield packet(0)
+
+
+def generate_level14(size: int, random: Random) -> Iterator[str]:
+    spread = 50 + size
+    for _ in range(size):
+        x, y = random.randint(500 - spread, 500 + spread), random.randint(2, 20 + size)
+        points = [f"{x},{y}"]
+        for i in range(random.randint(1, 4)):
+            if i % 2 == 0:
+                x += random.choice([-1, 1]) * random.randint(1, 8)
+            else:
+                y += random.randint(1, 8)
+            points.append(f"{x},{y}")
+        yield " -> ".join(points)
+
+
+def generate_level15(size: int, random: Random) -> Iterator[str]:
+    # Like in the puzzle, the sensors cover the whole search square except for one hidden point. A sensor per
+    # quadrant around the hidden point, extent steps away on both axes with a reach of 2 * extent - 1, covers its
+    # closed quadrant of the square up to the hidden point itself. The other sensors stay short of the hidden point.
+    limit = 4000000
+    hidden_x, hidden_y = random.randint(0, limit), random.randint(0, limit)
+    sensors: List[Tuple[int, int, int, int]] = []
+    for direction_x, direction_y in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
+        extent_x = limit - hidden_x if direction_x > 0 else hidden_x
+        extent_y = limit - hidden_y if direction_y > 0 else hidden_y
+        extent = max(1, extent_x, extent_y)
+        x, y = hidden_x + direction_x * extent, hidden_y + direction_y * extent
+        sensors.append((x, y, x - direction_x * (2 * extent - 1), y))
+    while len(sensors) < size:
+        x, y = random.randint(0, limit), random.randint(0, limit)
+        distance = abs(x - hidden_x) + abs(y - hidden_y)
+        if distance < 2:
+            continue
+        reach = random.randint(1, distance - 1)
+        beacon_dx = random.randint(-reach, reach)
+        beacon_dy = (reach - abs(beacon_dx)) * random.choice([-1, 1])
+        sensors.append((x, y, x + beacon_dx, y + beacon_dy))
+    random.shuffle(sensors)
+    for x, y, beacon_x, beacon_y in sensors:
+        yield f"Sensor at x={x}, y={y}: closest beacon is at x={beacon_x}, y={beacon_y}"
+
+
+# The runner starts its routes at these valves
+LEVEL16_FIXED_VALVES = ["TA", "QK", "JA", "VK", "ID", "DC", "XN", "DH"]
+
+
+def generate_level16(size: int, random: Random) -> Iterator[str]:
+    names = ["AA"] + LEVEL16_FIXED_VALVES
+    index = 0
+    while len(names) < max(size, len(names)):
+        name = get_name(index, 2 if index < 26 * 26 else 3, string.ascii_uppercase)
+        if name not in names:
+            names.append(name)
+        index += 1
+
+    # a random tree keeps every valve reachable, the extra tunnels add loops
+    tunnels: Dict[str, set] = {name: set() for name in names}
+    for i in range(1, len(names)):
+        other = names[random.randrange(i)]
+        tunnels[names[i]].add(other)
+        tunnels[other].add(names[i])
+    for _ in range(len(names) // 2):
+        first, second = random.sample(names, 2)
+        tunnels[first].add(second)
+        tunnels[second].add(first)
+
+    for name in names:
+        if name in LEVEL16_FIXED_VALVES or (name != "AA" and random.random() < 0.25):
+            flow_rate = random.randint(3, 25)
+        else:
+            flow_rate = 0
+        targets = sorted(tunnels[name])
+        if len(targets) == 1:
+            yield f"Valve {name} has flow rate={flow_rate}; tunnel leads to valve {targets[0]}"
+        else:
+            yield f"Valve {name} has flow rate={flow_rate}; tunnels lead to valves {', '.join(targets)}"
+
+
+def generate_level17(size: int, random: Random) -> Iterator[str]:
+    yield "".join(random.choice("<>") for _ in range(size))
+
+
+def generate_level18(size: int, random: Random) -> Iterator[str]:
+    side = max(3, round((size * 2) ** (1 / 3)))
+    for cube_id in random.sample(range(side ** 3), min(size, side ** 3)):
+        z, rest = divmod(cube_id, side * side)
+        y, x = divmod(rest, side)
+        yield f"{x},{y},{z}"
+
+
+def generate_level19(size: int, random: Random) -> Iterator[str]:
+    # cheaper ore robots than in the real inputs let the number of states explode
+    for i in range(size):
+        yield (
+            f"Blueprint {i + 1}: Each ore robot costs {random.randint(3, 4)} ore. "
+            f"Each clay robot costs {random.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {random.randint(2, 4)} ore and {random.randint(7, 20)} clay. "
+            f"Each geode robot costs {random.randint(2, 4)} ore and {random.randint(7, 20)} obsidian."
+        )
+
+
+def generate_level20(size: int, random: Random) -> Iterator[str]:
+    # the mixed list must contain exactly one zero
+    zero_index = random.randrange(size)
+    for i in range(size):
+        if i == zero_index:
+            yield "0"
+        else:
+            yield str(random.choice([-1, 1]) * random.randint(1, 10000))
+
+
+LEVEL21_OPERATIONS: Dict[str, Callable[[int, int], int]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+}
+
+
+def generate_level21(size: int, random: Random) -> Iterator[str]:
+    # monkeys are merged pairwise into a random tree, divisions are only used when they are exact
+    num_leaves = max(2, (size + 1) // 2)
+    names = [get_name(i, 4) for i in range(num_leaves * 2 + 2) if get_name(i, 4) not in ["root", "humn"]]
+    names[0] = "humn"
+    values = {name: random.randint(1, 20) for name in names[:num_leaves]}
+    lines = [f"{name}: {value}" for name, value in values.items()]
+    pool = list(values)
+    next_name = num_leaves
+    while len(pool) > 1:
+        left = pool.pop(random.randrange(len(pool)))
+        right = pool.pop(random.randrange(len(pool)))
+        name = "root" if len(pool) == 0 else names[next_name]
+        next_name += 1
+        if values[right] > 1 and values[left] % values[right] == 0:
+            operation = "/"
+        elif abs(values[left]) < 1000 and abs(values[right]) < 1000:
+            operation = random.choice("+-*")
+        else:
+            operation = random.choice("+-")
+        values[name] = LEVEL21_OPERATIONS[operation](values[left], values[right])
+        lines.append(f"{name}: {left} {operation} {right}")
+        pool.append(name)
+    random.shuffle(lines)
+    yield from lines
+
+
+def generate_level22(size: int, random: Random) -> Iterator[str]:
+    # cube net of layout 1, the layout used by the real inputs
+    face_length = get_side(size // 6)
+    faces = [(1, 0), (2, 0), (1, 1), (0, 2), (1, 2), (0, 3)]
+    for y in range(face_length * 4):
+        line = ""
+        for face_x in range(3):
+            if (face_x, y // face_length) in faces:
+                for x in range(face_length):
+                    is_start = y == 0 and face_x == 1 and x == 0
+                    line += "#" if random.random() < 0.1 and not is_start else "."
+            else:
+                line += " " * face_length
+        yield line.rstrip()
+    yield ""
+    path = ""
+    for i in range(face_length * 4):
+        path += str(random.randint(1, face_length)) + ("" if i == face_length * 4 - 1 else random.choice("LR"))
+    yield path
+
+
+def generate_level23(size: int, random: Random) -> Iterator[str]:
+    side = get_side(size)
+    for _ in range(side):
+        yield "".join("#" if random.random() < 0.4 else "." for _ in range(side))
+
+
+def generate_level24(size: int, random: Random) -> Iterator[str]:
+    height = max(3, math.isqrt(size // 4))
+    width = max(3, size // height)
+    yield "#." + "#" * width
+    for _ in range(height):
+        line = "#"
+        for x in range(width):
+            if random.random() < 0.35:
+                # vertical blizzards would block the entrance or the exit
+                line += random.choice("<>" if x in [0, width - 1] else "<>^v")
+            else:
+                line += "."
+        yield line + "#"
+    yield "#" * width + ".#"
+
+
+def decimal_to_snafu(decimal: int) -> str:
+    snafu = ""
+    while decimal > 0:
+        decimal, digit = divmod(decimal + 2, 5)
+        snafu = SNAFU_DIGITS[digit] + snafu
+    return snafu
+
+
+def generate_level25(size: int, random: Random) -> Iterator[str]:
+    for _ in range(size):
+        yield decimal_to_snafu(random.randint(1, 5 ** random.randint(1, 20)))
+
+
+GENERATORS: Dict[int, Generator] = {
+    1: generate_level1,
+    2: generate_level2,
+    3: generate_level3,
+    4: generate_level4,
+    5: generate_level5,
+    6: generate_level6,
+    7: generate_level7,
+    8: generate_level8,
+    9: generate_level9,
+    10: generate_level10,
+    11: generate_level11,
+    12: generate_level12,
+    13: generate_level13,
+    14: generate_level14,
+    15: generate_level15,
+    16: generate_level16,
+    17: generate_level17,
+    18: generate_level18,
+    19: generate_level19,
+    20: generate_level20,
+    21: generate_level21,
+    22: generate_level22,
+    23: generate_level23,
+    24: generate_level24,
+    25: generate_level25,
+}
+
+# Sizes that roughly match the real inputs
+BASE_SIZES: Dict[int, int] = {
+    1: 250,
+    2: 2500,
+    3: 300,
+    4: 1000,
+    5: 500,
+    6: 4096,
+    7: 900,
+    8: 9801,
+    9: 2000,
+    10: 145,
+    11: 36,
+    12: 6642,
+    13: 150,
+    14: 130,
+    15: 28,
+    16: 57,
+    17: 10091,
+    18: 2868,
+    19: 30,
+    20: 5000,
+    21: 2255,
+    22: 15000,
+    23: 5329,
+    24: 3600,
+    25: 121,
+}
+
+
+def write_input(level: int, size: int, path: Path | str, seed: int = 0):
+    random = Random(seed)
+    with open_output_file(path) as output_file:
+        for line in GENERATORS[level](size, random):
+            output_file.write(line)
+            output_file.write("\n")
+
+
+def parse_arguments(arguments: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.generators", description="Generate large inputs for Advent of Code 2022 levels"
+    )
+    parser.add_argument("level", type=int, choices=sorted(GENERATORS), help="level to generate an input for")
+    parser.add_argument("output", type=Path, help="output file, .gz, .xz and .zst files are compressed")
+    parser.add_argument("-s", "--size", type=int, help="number of records or grid cells, defaults to the real size")
+    parser.add_argument("--scale", type=int, default=1, help="multiplier for the size")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: List[str] | None = None):
+    args = parse_arguments(arguments)
+    size = args.size if args.size is not None else BASE_SIZES[args.level]
+    write_input(args.level, size * args.scale, args.output, args.seed)
+
+
+if __name__ == "__main__":
+    main()
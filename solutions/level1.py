@@ -1,6 +1,9 @@
-from typing import List, Tuple
+from heapq import heappush, heapreplace
+from typing import Iterable, Iterator, List, Tuple
 
-from util.file_util import read_input_file
+from util.file_util import iterate_input_file, map_or_stream_input_file
+from util.instrumentation import timed
+from util.numpy_util import CHUNK_SIZE, iterate_line_integers
 
 
 class Elf:
@@ -16,11 +19,11 @@ class Elf:
         return sum(self.items)
 
 
+@timed("level1.parse_input_file")
 def parse_input_file() -> List[Elf]:
-    lines = read_input_file(1)
     all_elves: List[Elf] = list()
     new_elf = Elf()
-    for line in lines:
+    for line in iterate_input_file(1):
         if line == "":
             all_elves.append(new_elf)
             new_elf = Elf()
@@ -30,6 +33,29 @@ def parse_input_file() -> List[Elf]:
     return all_elves
 
 
+def iterate_elf_totals(lines: Iterable[str]) -> Iterator[int]:
+    total = 0
+    for line in lines:
+        if line == "":
+            yield total
+            total = 0
+        else:
+            total += int(line)
+    yield total
+
+
+def find_top_elves(totals: Iterable[int], k: int) -> List[Tuple[int, int]]:
+    # min-heap of the k largest (total, -index) pairs, equal totals keep the earlier elf
+    heap: List[Tuple[int, int]] = []
+    for index, total in enumerate(totals):
+        if len(heap) < k:
+            heappush(heap, (total, -index))
+        elif total > heap[0][0]:
+            heapreplace(heap, (total, -index))
+    return [(total, -negative_index) for total, negative_index in sorted(heap, reverse=True)]
+
+
+@timed("level1.level1")
 def level1() -> Tuple[Elf, int]:
     elves = parse_input_file()
     elves.sort(key=Elf.total_weight, reverse=True)
@@ -39,6 +65,57 @@ def level1() -> Tuple[Elf, int]:
     return max_elf, max_three_elves_weight
 
 
+@timed("level1.level1_top")
+def level1_top(k: int = 3) -> List[Tuple[int, int]]:
+    # streams the input, so memory stays O(k) however many elves there are
+    return find_top_elves(iterate_elf_totals(iterate_input_file(1)), k)
+
+
+def iterate_group_totals(buffer: bytes | Iterable[bytes], chunk_size: int = CHUNK_SIZE) -> Iterator["ndarray"]:
+    # the totals of the groups that end in each chunk, a group runs up to and including its blank line,
+    # which parses as 0
+    import numpy
+
+    carry = 0
+    for values, blank in iterate_line_integers(buffer, chunk_size):
+        group_starts = numpy.concatenate(([0], numpy.flatnonzero(blank) + 1))
+        sums = numpy.add.reduceat(values, group_starts[group_starts < len(values)])
+        sums[0] += carry
+        if blank[-1]:
+            yield sums
+            carry = 0
+        else:
+            yield sums[:-1]
+            carry = sums[-1]
+    yield numpy.array([carry], dtype=numpy.int64)
+
+
+def calc_group_totals(buffer: bytes | Iterable[bytes], chunk_size: int = CHUNK_SIZE) -> "ndarray":
+    import numpy
+
+    return numpy.concatenate(list(iterate_group_totals(buffer, chunk_size)))
+
+
+@timed("level1.level1_batch")
+def level1_batch(k: int = 3) -> List[Tuple[int, int]]:
+    # only the k best totals so far are kept, so the memory does not grow with the input
+    import numpy
+
+    best_totals = numpy.zeros(0, dtype=numpy.int64)
+    best_indices = numpy.zeros(0, dtype=numpy.int64)
+    num_groups = 0
+    with map_or_stream_input_file(1) as buffer:
+        for totals in iterate_group_totals(buffer):
+            indices = numpy.arange(num_groups, num_groups + len(totals))
+            num_groups += len(totals)
+            # the earlier candidates come first, so the stable sort keeps the earlier elf on equal totals
+            totals = numpy.concatenate((best_totals, totals))
+            indices = numpy.concatenate((best_indices, indices))
+            order = numpy.argsort(-totals, kind="stable")[:k]
+            best_totals, best_indices = totals[order], indices[order]
+    return [(int(total), int(index)) for total, index in zip(best_totals, best_indices)]
+
+
 if __name__ == "__main__":
     _max_elf, _max_three_elves_weight = level1()
     print("Max carrying elf: " + str(_max_elf.total_weight()))
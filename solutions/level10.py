@@ -1,8 +1,10 @@
 from typing import Dict
 
 from util.file_util import read_input_file
+from util.instrumentation import timed
 
 
+@timed("level10.parse_input_file")
 def parse_input_file() -> Dict[int, int]:
     lines = read_input_file(10)
     value_at_cycle: Dict[int, int] = {}
@@ -25,6 +27,7 @@ def parse_input_file() -> Dict[int, int]:
     return value_at_cycle
 
 
+@timed("level10.level10_1")
 def level10_1() -> int:
     value_at_cycle = parse_input_file()
     result = 0
@@ -33,6 +36,7 @@ def level10_1() -> int:
     return result
 
 
+@timed("level10.level10_2")
 def level10_2() -> str:
     value_at_cycle = parse_input_file()
     output = ""
@@ -4,6 +4,7 @@ from operator import mul
 from typing import Dict, List, Any
 
 from util.file_util import read_input_file
+from util.instrumentation import progress, timed
 
 
 class Monkey:
@@ -56,6 +57,7 @@ def read_monkey(lines: List[str]) -> Monkey:
     return monkey
 
 
+@timed("level11.parse_input_file")
 def parse_input_file() -> Dict[int, Monkey]:
     lines = read_input_file(11)
     monkey_dict: Dict[int, Monkey] = {}
@@ -65,10 +67,12 @@ def parse_input_file() -> Dict[int, Monkey]:
     return monkey_dict
 
 
+@timed("level11.level11")
 def level11(worry_decrease: int, rounds: int) -> int:
     monkeys = parse_input_file()
     max_worry = reduce(mul, map(lambda m: m.test_target, monkeys.values()), 1)
-    for _ in range(rounds):
+    for round_i in range(rounds):
+        progress("level11.rounds", round_i, rounds)
         for monkey in monkeys.values():
             monkey.throw_all_items(monkeys, worry_decrease, max_worry)
     inspection_counts = list(map(lambda m: m.inspection_count, monkeys.values()))
@@ -1,74 +1,60 @@
-from typing import List, Tuple
+from string import ascii_lowercase
+from typing import Iterator, List, Tuple
 
 from util.file_util import read_input_file
+from util.grid import Grid
+from util.instrumentation import timed
+from util.search import UNREACHED, bfs
+
+HEIGHTS = {char: height for height, char in enumerate(ascii_lowercase)} | {"S": 0, "E": 25}
 
 
 class Landscape:
-    height: List[List[int]]  # y,x
-    steps_to_end: List[List[int]]  # y,x
+    height: Grid
+    steps_to_end: Grid
     start: Tuple[int, int]  # y,x
     end: Tuple[int, int]  # y,x
 
     def __init__(self, lines: List[str]):
-        self.height = []
-        for y in range(len(lines)):
-            new_line = []
-            for x in range(len(lines[y])):
-                c = lines[y][x]
-                if c == "S":
-                    new_line.append(0)
-                    self.start = y, x
-                elif c == "E":
-                    new_line.append(25)
-                    self.end = y, x
-                else:
-                    new_line.append(ord(c) - ord("a"))
-            self.height.append(new_line)
+        for y, line in enumerate(lines):
+            if "S" in line:
+                self.start = y, line.index("S")
+            if "E" in line:
+                self.end = y, line.index("E")
+        self.height = Grid.from_lines(lines, HEIGHTS)
         self.start_flood_fill()
 
     def get_path_length(self):
-        return self.steps_to_end[self.start[0]][self.start[1]]
+        return self.steps_to_end[self.start[1], self.start[0]]
 
     def start_flood_fill(self):
-        self.steps_to_end = list(map(lambda line: list(map(lambda _: 10000000, line)), self.height))
-        self.steps_to_end[self.end[0]][self.end[1]] = 0
-        self.flood_fill(self.end[1], self.end[0])
-
-    def flood_fill(self, x: int, y: int):
-        filled_fields = self.set_neighbors(x, y)
-        for field in filled_fields:
-            self.flood_fill(field[1], field[0])
-
-    def set_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
-        filled_fields: List[Tuple] = []
-        source_height = self.height[y][x]
-        source_steps = self.steps_to_end[y][x]
-        for y_plus, x_plus in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-            check_y = y + y_plus
-            check_x = x + x_plus
-            if 0 <= check_y < len(self.steps_to_end) and 0 <= check_x < len(self.steps_to_end[check_y]):
-                target_height = self.height[check_y][check_x]
-                if target_height - source_height > -2 and self.steps_to_end[check_y][check_x] > source_steps + 1:
-                    self.steps_to_end[check_y][check_x] = source_steps + 1
-                    filled_field = (check_y, check_x)
-                    filled_fields.append(filled_field)
-        return filled_fields
+        # the search runs backwards from the end, so every field gets its distance to the end in one pass
+        end = self.height.index(self.end[1], self.end[0])
+        search = bfs([end], self.get_climbable_from, len(self.height.cells), track_paths=False)
+        self.steps_to_end = Grid(self.height.width, self.height.height, typecode="i", cells=search.distances)
+
+    def get_climbable_from(self, index: int) -> Iterator[int]:
+        source_height = self.height.cells[index]
+        for neighbour in self.height.neighbour_indices(index):
+            if self.height.cells[neighbour] - source_height > -2:
+                yield neighbour
 
 
+@timed("level12.parse_input_file")
 def parse_input_file() -> Landscape:
     lines = read_input_file(12)
     return Landscape(lines)
 
 
 def get_minimal_path_from_a(landscape: Landscape) -> int:
-    min_steps = 1000000
-    for y in range(len(landscape.steps_to_end)):
-        for x in range(len(landscape.steps_to_end[y])):
-            if landscape.height[y][x] == 0:
-                min_steps = min(min_steps, landscape.steps_to_end[y][x])
-    return min_steps
+    return min(
+        steps
+        for height, steps in zip(landscape.height.cells, landscape.steps_to_end.cells)
+        if height == 0 and steps != UNREACHED
+    )
 
 
+@timed("level12.level12")
 def level12() -> Tuple[int, int]:
     landscape = parse_input_file()
     num_steps1 = landscape.get_path_length()
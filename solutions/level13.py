@@ -2,6 +2,7 @@ from functools import cmp_to_key
 from typing import List, Any
 
 from util.file_util import read_input_file
+from util.instrumentation import timed
 
 
 class Packet:
@@ -79,6 +80,7 @@ def compare_packets(left: Packet, right: Packet) -> int:
         return 0
 
 
+@timed("level13.parse_input_file_in_pairs")
 def parse_input_file_in_pairs() -> List[PacketPair]:
     lines = read_input_file(13)
     packet_pairs: List[PacketPair] = []
@@ -87,6 +89,7 @@ def parse_input_file_in_pairs() -> List[PacketPair]:
     return packet_pairs
 
 
+@timed("level13.parse_input_file_as_list")
 def parse_input_file_as_list() -> List[Packet]:
     lines = read_input_file(13)
     packets: List[Packet] = []
@@ -98,6 +101,7 @@ def parse_input_file_as_list() -> List[Packet]:
     return packets
 
 
+@timed("level13.level13_1")
 def level13_1() -> int:
     packet_pairs = parse_input_file_in_pairs()
     packets_in_right_order = filter(PacketPair.is_in_right_order, packet_pairs)
@@ -105,6 +109,7 @@ def level13_1() -> int:
     return sum_ids
 
 
+@timed("level13.level13_2")
 def level13_2() -> int:
     packets = parse_input_file_as_list()
     packets.sort(key=cmp_to_key(compare_packets))
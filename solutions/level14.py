@@ -1,13 +1,20 @@
-from enum import Enum
+from enum import IntEnum
 from typing import List, Tuple
 
 from util.file_util import read_input_file
+from util.grid import Grid
+from util.instrumentation import count, timed
 
 
-class Material(Enum):
-    AIR = "."
-    STONE = "#"
-    SAND = "o"
+class Material(IntEnum):
+    AIR = ord(".")
+    STONE = ord("#")
+    SAND = ord("o")
+
+
+# the hot loop compares plain ints, IntEnum comparisons cost a method call each
+AIR = int(Material.AIR)
+SAND = int(Material.SAND)
 
 
 class Line:
@@ -40,7 +47,7 @@ class Line:
 
 
 class Structure:
-    area: List[List[Material]]
+    area: Grid
     sand_start_x: int
     height: int
 
@@ -61,59 +68,70 @@ class Structure:
             distance_x += 2 * distance_y
             lines.append(Line(min_x, max_y, max_x, max_y))
 
+        # an empty column on both sides lets sand fall past the edges without bounds checks
+        min_x -= 1
+        distance_x += 2
         self.sand_start_x = 500 - min_x
         self.height = max_y
-        area = [[Material.AIR] * distance_x for _ in range(distance_y)]
+        area = Grid(distance_x, distance_y, Material.AIR)
         for line in lines:
             for coordinate in line.get_coordinates():
                 y = coordinate[1]
                 x = coordinate[0] - min_x
-                area[y][x] = Material.STONE
+                area[x, y] = Material.STONE
         self.area = area
 
     def fill(self):
+        cells = self.area.cells
+        width = self.area.width
+        num_sand_units = 0
         spot_x, spot_y = self.find_next_sand_spot()
         while spot_x is not None:
-            self.area[spot_y][spot_x] = Material.SAND
+            cells[spot_y * width + spot_x] = SAND
+            num_sand_units += 1
             spot_x, spot_y = self.find_next_sand_spot()
             if spot_x == self.sand_start_x and spot_y == 0:
-                self.area[spot_y][spot_x] = Material.SAND
-                return
-
-    def find_next_sand_spot(self, ) -> Tuple[int | None, int | None]:
-        last_check_x, last_check_y = -1, -1
-        check_x, check_y = self.sand_start_x, 0
-        while last_check_x != check_x and last_check_y != check_y:
-            last_check_x, last_check_y = check_x, check_y
-            if check_y == self.height:
-                return None, None
-            while self.area[check_y + 1][check_x] == Material.AIR:
-                check_y += 1
-                if check_y == self.height:
+                cells[spot_x] = SAND
+                num_sand_units += 1
+                break
+        count("level14.sand_units", num_sand_units)
+
+    def find_next_sand_spot(self) -> Tuple[int | None, int | None]:
+        # works on cell indices, the row below is one width further and the last row starts at bottom
+        cells = self.area.cells
+        width = self.area.width
+        bottom = self.height * width
+        index = self.sand_start_x
+        while index < bottom:
+            below = index + width
+            while cells[below] == AIR:
+                index = below
+                if index >= bottom:
                     return None, None
-            if self.area[check_y + 1][check_x - 1] == Material.AIR:
-                check_x -= 1
-                check_y += 1
-            elif self.area[check_y + 1][check_x + 1] == Material.AIR:
-                check_x += 1
-                check_y += 1
-        return check_x, check_y
+                below += width
+            if cells[below - 1] == AIR:
+                index = below - 1
+            elif cells[below + 1] == AIR:
+                index = below + 1
+            else:
+                return index % width, index // width
+        return None, None
 
     def get_num_sand(self) -> int:
-        return sum(map(lambda area_line: len(list(filter(lambda point: point == Material.SAND, area_line))), self.area))
+        return self.area.count(Material.SAND)
 
     def print(self):
-        for line in self.area:
-            print("".join(map(lambda c: c.value, line)))
+        for line in self.area.to_lines():
+            print(line)
 
     def print_to_file(self):
         out_file = open("structure.txt", "w")
-        for line in self.area:
-            line = "".join(map(lambda c: c.value, line)) + "\n"
-            out_file.write(line)
+        for line in self.area.to_lines():
+            out_file.write(line + "\n")
         out_file.close()
 
 
+@timed("level14.parse_input_file")
 def parse_input_file() -> List[Line]:
     file_lines = read_input_file(14)
     lines: List[Line] = []
@@ -131,10 +149,12 @@ def parse_input_file() -> List[Line]:
     return lines
 
 
+@timed("level14.level14")
 def level14() -> Tuple[int, int]:
-    structure1 = Structure(parse_input_file(), False)
+    lines = parse_input_file()
+    structure1 = Structure(lines.copy(), False)
     structure1.fill()
-    structure2 = Structure(parse_input_file(), True)
+    structure2 = Structure(lines.copy(), True)
     structure2.fill()
     return structure1.get_num_sand(), structure2.get_num_sand()
 
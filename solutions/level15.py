@@ -1,8 +1,8 @@
-import time
 from enum import Enum
 from typing import List, Tuple
 
 from util.file_util import read_input_file
+from util.instrumentation import enable, progress, report, timed, timer
 
 
 class Sensor:
@@ -97,11 +97,13 @@ class Field:
             return None
 
 
+@timed("level15.parse_input_file")
 def parse_input_file() -> Field:
     lines = read_input_file(15)
     return Field(lines)
 
 
+@timed("level15.level15")
 def level15(y_level_1: int, max_level_2: int) -> Tuple[int, int]:
     field = parse_input_file()
 
@@ -109,17 +111,16 @@ def level15(y_level_1: int, max_level_2: int) -> Tuple[int, int]:
     level_1 = len(list(filter(lambda p: p == Position.Signal, level_1_line)))
 
     for y in range(0, max_level_2 + 1):
-        if y > 0 and y % 10000 == 0:  # prevent for tests
-            print(f"Checking line {y}", flush=True)
+        progress("level15.lines", y, max_level_2 + 1)
         uncovered_x = field.get_uncovered_x(y, max_level_2)
         if uncovered_x is not None:
             return level_1, uncovered_x * 4000000 + y
 
 
 if __name__ == "__main__":
-    startTime = time.time()
-    _signal_spots, _tuning_frequency = level15(2000000, 4000000)
+    enable()
+    with timer("level15.main"):
+        _signal_spots, _tuning_frequency = level15(2000000, 4000000)
     print(f"Signal spots: {_signal_spots}")
     print(f"Tuning frequency: {_tuning_frequency}")
-    executionTime = time.time() - startTime
-    print("Execution time in seconds: " + str(executionTime))
+    report()
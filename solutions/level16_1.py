@@ -1,8 +1,10 @@
 from collections import deque
 from random import shuffle
-from typing import List, Dict, Set, Deque
+from typing import List, Dict, Deque, Tuple
 
 from util.file_util import read_input_file
+from util.instrumentation import log, progress, timed
+from util.search import all_pairs
 
 
 class Valve:
@@ -18,60 +20,46 @@ class Valve:
         self.connected_rooms = connection_str.split(", ")
 
 
+@timed("level16_1.parse_input_file")
 def parse_input_file() -> Dict[str, Valve]:
     lines = read_input_file(16)
     valves = map(Valve, lines)
     return {valve.id: valve for valve in valves}
 
 
-# https://onestepcode.com/graph-shortest-path-python/
-def shortest_path(graph: Dict[str, Valve], start, end) -> Deque[str]:
-    path_list: List[Deque[str]] = [[start]]
-    path_index = 0
-    # To keep track of previously visited nodes
-    previous_nodes: Set[str] = {start}
-    if start == end:
-        return path_list[0]
+def find_shortest_paths(graph: Dict[str, Valve]) -> Dict[Tuple[str, str], List[str]]:
+    # the tunnels never change, so the paths between all rooms are searched once up front
+    names = list(graph)
+    ids = {name: i for i, name in enumerate(names)}
+    connections = [[ids[room] for room in graph[name].connected_rooms] for name in names]
+    searches = all_pairs(len(names), connections.__getitem__)
+    return {
+        (start, end): [names[node] for node in searches[ids[start]].path(ids[end])]
+        for start in names
+        for end in names
+    }
 
-    while path_index < len(path_list):
-        current_path = path_list[path_index]
-        last_node = current_path[-1]
-        next_nodes = graph[last_node].connected_rooms
-        # Search goal node
-        if end in next_nodes:
-            current_path.append(end)
-            return current_path[1:]
-        # Add new paths
-        for next_node in next_nodes:
-            if next_node not in previous_nodes:
-                new_path = current_path[:]
-                new_path.append(next_node)
-                path_list.append(new_path)
-                # To avoid backtracking
-                previous_nodes.add(next_node)
-        # Continue to next path in list
-        path_index += 1
-    # No path is found
-    return deque()
 
-
-def find_steps(graph: Dict[str, Valve], route: List[str]) -> Deque[str]:
+def find_steps(paths: Dict[Tuple[str, str], List[str]], route: List[str]) -> Deque[str]:
     steps: Deque[str] = deque()
     for i in range(len(route) - 1):
-        steps.extend(shortest_path(graph, route[i], route[i + 1]))
+        steps.extend(paths[route[i], route[i + 1]])
     return steps
 
 
+@timed("level16_1.level16_1")
 def level16_1(rounds: int, targets_start: list[str]) -> int:
     valves = parse_input_file()
+    paths = find_shortest_paths(valves)
     all_targets = list(filter(lambda valve: valves[valve].flow_rate > 0, valves))
     reduced_targets = [target for target in all_targets if target not in targets_start]
     max_pressure = 0
     for i in range(rounds):
+        progress("level16_1.rounds", i, rounds)
         shuffle(reduced_targets)
         targets = targets_start + reduced_targets
         next_target = 0
-        steps = find_steps(valves, ["AA"] + targets)
+        steps = find_steps(paths, ["AA"] + targets)
         current_room = "AA"
         pressure_release_per_minute = 0
         pressure_released = 0
@@ -87,8 +75,7 @@ def level16_1(rounds: int, targets_start: list[str]) -> int:
             elif len(steps) > 0:
                 current_room = steps.popleft()
         if max_pressure < pressure_released:
-            if i > 2000:
-                print(f"New best route! pressure: {pressure_released}, route: {' -> '.join(targets)}")
+            log("level16_1", f"New best route! pressure: {pressure_released}, route: {' -> '.join(targets)}")
             max_pressure = pressure_released
     return max_pressure
 
@@ -1,6 +1,8 @@
 from typing import List, Set, Tuple
 
+from util.coordinates import pack
 from util.file_util import read_input_file
+from util.instrumentation import timed
 
 
 def rock_str_to_array(rock: str) -> List[List[bool]]:
@@ -8,12 +10,17 @@ def rock_str_to_array(rock: str) -> List[List[bool]]:
     return list(map(lambda line: list(map(lambda char: char == "#", line)), lines))
 
 
+FIELD_WIDTH = 7
+FIELD_CENTER = FIELD_WIDTH // 2  # packed x runs from -3 to 3
+
+
 def calc_field_id(x: int, y: int) -> int:
-    return y * 7 + x
+    return pack(x - FIELD_CENTER, y, FIELD_WIDTH)
 
 
 class Rock:
     fields: List[Tuple[int, int]]
+    field_offsets: List[int]  # packed offsets from the top left corner, rows counting downwards
     height: int
     width: int
 
@@ -24,6 +31,7 @@ class Rock:
             for x in range(len(lines[0])):
                 if lines[y][x]:
                     self.fields.append((x, y))
+        self.field_offsets = [pack(x, -y, FIELD_WIDTH) for x, y in self.fields]
         self.height = len(lines)
         self.width = len(lines[0])
 
@@ -59,7 +67,7 @@ class Field:
                 x_plus = self.winds[self.next_wind]
                 self.next_wind = (self.next_wind + 1) % len(self.winds)
 
-                new_x = max(0, min(7 - rock.width, x + x_plus))
+                new_x = max(0, min(FIELD_WIDTH - rock.width, x + x_plus))
                 if not self.does_rock_collide(rock, new_x, y):
                     x = new_x
 
@@ -80,9 +88,9 @@ class Field:
         if y - rock.height < -1:
             return True
 
-        for field in rock.fields:
-            test_x, test_y = x + field[0], y - field[1]
-            if self.is_field_filled(test_x, test_y):
+        place_id = calc_field_id(x, y)
+        for offset in rock.field_offsets:
+            if place_id + offset in self.filled_positions:
                 return True
 
         return False
@@ -101,18 +109,20 @@ class Field:
     def print_field(self, height: int):
         for y in range(height - 1, -1, -1):
             line = "|"
-            for x in range(7):
+            for x in range(FIELD_WIDTH):
                 line += "#" if self.is_field_filled(x, y) else "."
             line += "|"
             print(line)
         print("+-------+")
 
 
+@timed("level17.parse_input_file")
 def parse_input_file() -> Field:
     lines = read_input_file(17)
     return Field(lines[0])
 
 
+@timed("level17.level17")
 def level17(
     num_rocks: int, pattern_start: int = -1, pattern_length: int = -1, print_height_differences: bool = False
 ) -> int:
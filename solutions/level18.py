@@ -1,7 +1,12 @@
 from enum import Enum
 from typing import List, Set, Tuple
 
+from util.cache import cached, get_lines_digest
+from util.coordinates import pack3, unpack3
 from util.file_util import read_input_file
+from util.instrumentation import timed, timer
+
+PARSER_VERSION = 2
 
 
 class GridEntry(Enum):
@@ -76,14 +81,13 @@ class Droplet:
             and self.get_grid_id(x, y, z) not in check_fields_set
         )
 
-    def get_grid_id(self, x: int, y: int, z: int) -> int:
-        return z * self.grid_size_y * self.grid_size_x + y * self.grid_size_x + x
+    @staticmethod
+    def get_grid_id(x: int, y: int, z: int) -> int:
+        return pack3(x, y, z)
 
-    def get_grid_coordinates(self, _id: int) -> Tuple[int, int, int]:
-        z = _id // (self.grid_size_y * self.grid_size_x)
-        y = (_id % (self.grid_size_y * self.grid_size_x)) // self.grid_size_x
-        x = _id % self.grid_size_x
-        return x, y, z
+    @staticmethod
+    def get_grid_coordinates(_id: int) -> Tuple[int, int, int]:
+        return unpack3(_id)
 
     def calc_surface_area(self) -> int:
         surface_area = 0
@@ -122,8 +126,10 @@ class Droplet:
             return 1
 
 
+@timed("level18.level18")
 def level18(lines: List[str]) -> Tuple[int, int]:
-    droplet = Droplet(lines)
+    with timer("level18.parse"):
+        droplet = cached("droplet", lambda: get_lines_digest(lines), PARSER_VERSION, lambda: Droplet(lines))
     return droplet.calc_surface_area(), droplet.calc_outer_surface_area()
 
 
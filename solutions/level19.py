@@ -1,6 +1,7 @@
 from typing import List, Tuple, Dict
 
 from util.file_util import read_input_file
+from util.instrumentation import timed
 
 Robots = Dict[str, int]
 
@@ -62,6 +63,7 @@ class Blueprint:
         materials.decrease(self.robot_cost[robot])
 
 
+@timed("level19.parse_input_file")
 def parse_input_file() -> List[Blueprint]:
     lines = read_input_file(19)
     return list(map(Blueprint, lines))
@@ -176,6 +178,7 @@ def level19_part(minutes: int, blueprints: List[Blueprint]) -> Tuple[int, int]:
     return sum_quality, geode_product
 
 
+@timed("level19.level19")
 def level19() -> Tuple[int, int]:
     blueprints = parse_input_file()
     return level19_part(24, blueprints)[0], level19_part(32, blueprints[0:3])[1]
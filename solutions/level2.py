@@ -1,8 +1,11 @@
+from collections import Counter
 from enum import IntEnum
 
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
-from util.file_util import read_input_file
+from util.file_util import iterate_input_file, map_or_stream_input_file, read_input_file
+from util.instrumentation import timed
+from util.numpy_util import get_line_starts, iterate_chunks
 
 
 class Outcome(IntEnum):
@@ -83,8 +86,13 @@ def step2mapper(opponent: RPS, text: str) -> RPS:
     return step2map[text][opponent]
 
 
+@timed("level2.parse_input_file")
 def parse_input_file(mapper) -> List[Round]:
-    lines = read_input_file(2)
+    return parse_rounds(read_input_file(2), mapper)
+
+
+@timed("level2.parse_rounds")
+def parse_rounds(lines: List[str], mapper) -> List[Round]:
     all_rounds: List[Round] = list()
     for line in lines:
         parts = line.split(" ")
@@ -98,10 +106,71 @@ def calc_score(rounds: List[Round]) -> int:
     return sum(map(Round.get_points, rounds))
 
 
+# Every line is one of 9 rounds, code = 3 * opponent + column with both counted from 0
+ROUND_CODES = {f"{opponent} {you}": 3 * i + j for i, opponent in enumerate("ABC") for j, you in enumerate("XYZ")}
+
+
+def build_score_table(mapper) -> List[int]:
+    # the flattened 3x3 table of the points for each round code, derived from the Round model
+    table = [0] * len(ROUND_CODES)
+    for line, code in ROUND_CODES.items():
+        table[code] = parse_rounds([line], mapper)[0].get_points()
+    return table
+
+
+SCORE_TABLES = build_score_table(step1mapper), build_score_table(step2mapper)
+
+
+def count_round_codes(lines: Iterable[str]) -> List[int]:
+    counts = [0] * len(ROUND_CODES)
+    for line, num_rounds in Counter(lines).items():
+        if line == "":
+            continue
+        if line not in ROUND_CODES:
+            raise ValueError("Cannot parse input: " + line)
+        counts[ROUND_CODES[line]] += num_rounds
+    return counts
+
+
+def score_round_codes(counts: Iterable[int]) -> Tuple[int, int]:
+    counts = list(counts)
+    score1, score2 = (sum(num_rounds * points for num_rounds, points in zip(counts, table)) for table in SCORE_TABLES)
+    return score1, score2
+
+
+@timed("level2.count_round_codes_batch")
+def count_round_codes_batch(buffer: bytes | Iterable[bytes]) -> List[int]:
+    # the code comes from two bytes per line, so the file is never decoded
+    import numpy
+
+    counts = numpy.zeros(len(ROUND_CODES), dtype=numpy.int64)
+    for chunk in iterate_chunks(buffer):
+        starts = get_line_starts(chunk)
+        if len(starts) > 0 and starts[-1] + 2 >= len(chunk):
+            raise ValueError("Found an incomplete round at the end of the input")
+        # every line is exactly "<opponent> <you>", optionally followed by "\r"
+        if (chunk[starts + 1] != ord(" ")).any():
+            raise ValueError("Found a round without a space after the opponent")
+        line_ends = chunk[starts[starts + 3 < len(chunk)] + 3]
+        if ((line_ends != ord("\n")) & (line_ends != ord("\r"))).any():
+            raise ValueError("Found a round longer than three characters")
+        opponents = chunk[starts] - numpy.uint8(ord("A"))
+        yours = chunk[starts + 2] - numpy.uint8(ord("X"))
+        if (opponents > 2).any() or (yours > 2).any():  # anything below "A" or "X" wrapped around
+            raise ValueError("Found a round that is not A-C against X-Z")
+        counts += numpy.bincount(opponents * numpy.uint8(3) + yours, minlength=len(ROUND_CODES))
+    return [int(num_rounds) for num_rounds in counts]
+
+
+@timed("level2.level2")
 def level2() -> Tuple[int, int]:
-    rounds1 = parse_input_file(step1mapper)
-    rounds2 = parse_input_file(step2mapper)
-    return calc_score(rounds1), calc_score(rounds2)
+    return score_round_codes(count_round_codes(iterate_input_file(2)))
+
+
+@timed("level2.level2_batch")
+def level2_batch() -> Tuple[int, int]:
+    with map_or_stream_input_file(2) as buffer:
+        return score_round_codes(count_round_codes_batch(buffer))
 
 
 if __name__ == '__main__':
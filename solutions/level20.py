@@ -1,6 +1,7 @@
 from typing import List
 
 from util.file_util import read_input_file
+from util.instrumentation import progress, timed
 
 
 class Number:
@@ -12,6 +13,7 @@ class Number:
         self.id = _id
 
 
+@timed("level20.parse_input_file")
 def parse_input_file(decryption_key: int) -> List[Number]:
     lines = read_input_file(20)
     return list(map(lambda line: Number(line[1], line[0], decryption_key), enumerate(lines)))
@@ -21,12 +23,14 @@ def _print(numbers: List[Number]):
     print(", ".join(map(lambda n: str(n.value), numbers)))
 
 
+@timed("level20.level20")
 def level20(num_shuffles: int, decryption_key: int) -> int:
     numbers = parse_input_file(decryption_key)
     shuffled = parse_input_file(decryption_key)
     n = len(numbers)
 
-    for _ in range(num_shuffles):
+    for shuffle_i in range(num_shuffles):
+        progress("level20.shuffles", shuffle_i, num_shuffles)
         for number_i in range(len(numbers)):
             move_value = numbers[number_i]
             move_index = 0
@@ -2,6 +2,7 @@ from collections import defaultdict
 from typing import List, Dict, Tuple
 
 from util.file_util import read_input_file
+from util.instrumentation import timed
 
 
 FinishedMonkeys = Dict[str, int]
@@ -37,6 +38,7 @@ UnfinishedMonkeys = Dict[str, UnfinishedMonkey]
 UnfinishedMonkeyLookup = Dict[str, List[UnfinishedMonkey]]
 
 
+@timed("level21_1.parse_input_file")
 def parse_input_file() -> Tuple[FinishedMonkeys, UnfinishedMonkeys]:
     lines = read_input_file(21)
     finished_monkeys = {}
@@ -56,6 +58,7 @@ def finish_monkey(finished_monkey: str, unfinished_monkey_lookup: UnfinishedMonk
         unfinished_monkey.num_finished_parts += 1
 
 
+@timed("level21_1.level21_1")
 def level21_1() -> int:
     finished_monkeys, unfinished_monkeys = parse_input_file()
     unfinished_monkey_lookup: UnfinishedMonkeyLookup = defaultdict(list)
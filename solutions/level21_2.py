@@ -2,6 +2,7 @@ from collections import defaultdict
 from typing import List, Dict, Tuple
 
 from util.file_util import read_input_file
+from util.instrumentation import timed
 
 
 FinishedMonkeys = Dict[str, int]
@@ -82,6 +83,7 @@ UnfinishedMonkeys = Dict[str, UnfinishedMonkey]
 UnfinishedMonkeyLookup = Dict[str, List[UnfinishedMonkey]]
 
 
+@timed("level21_2.parse_input_file")
 def parse_input_file() -> Tuple[FinishedMonkeys, UnfinishedMonkeys]:
     lines = read_input_file(21)
     finished_monkeys = {}
@@ -163,6 +165,7 @@ def reverse_search(
     return target_number
 
 
+@timed("level21_2.level21_2")
 def level21_2() -> int:
     finished_monkeys, unfinished_monkeys, unfinished_monkey_lookup = setup()
     target_number, target_monkey_name = find_target(finished_monkeys, unfinished_monkeys, unfinished_monkey_lookup)
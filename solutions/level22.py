@@ -1,7 +1,12 @@
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Tuple
 
+from util.cache import cached_parse
 from util.file_util import read_input_file
+from util.grid import Grid
+from util.instrumentation import timed
+
+PARSER_VERSION = 2
 
 
 class WrapType(Enum):
@@ -9,10 +14,10 @@ class WrapType(Enum):
     Cube = 1
 
 
-class Tile(Enum):
-    Void = (" ",)
-    Free = (".",)
-    Wall = ("#",)
+class Tile(IntEnum):
+    Void = ord(" ")
+    Free = ord(".")
+    Wall = ord("#")
 
 
 class Direction(Enum):
@@ -65,21 +70,16 @@ class Direction(Enum):
 class Map:
     wrap_type: WrapType
     cube_layout: int
-    tiles: List[List[Tile]]
+    tiles: Grid
     path: List[str]
-    used_path: List[List[str]]
+    used_path: Grid
 
     def __init__(self, wrap_type: WrapType, lines: List[str], cube_layout: int = -1):
         self.wrap_type = wrap_type
         self.cube_layout = cube_layout
-        tiles_reverse = {
-            " ": Tile.Void,
-            ".": Tile.Free,
-            "#": Tile.Wall,
-        }
-
-        self.tiles = list(map(lambda line: [tiles_reverse[c] for c in line[:-1]], lines[:-2]))
-        self.used_path = list(map(lambda tiles: ["." for _ in tiles], self.tiles))
+        # the tile values are their characters, so the lines only need padding to the widest row
+        self.tiles = Grid.from_lines([line[:-1] for line in lines[:-2]], fill=Tile.Void)
+        self.used_path = Grid(self.tiles.width, self.tiles.height, ord("."))
         self.path = []
         path = lines[-1]
         number = ""
@@ -116,7 +116,7 @@ class Map:
         new_x = x + step_x
         new_y = y + step_y
         tile_type = self._get_type(new_x, new_y)
-        self.used_path[y][x] = direction.get_char()
+        self.used_path[x, y] = ord(direction.get_char())
         if tile_type == Tile.Wall:
             return x, y, direction, True
         elif tile_type == Tile.Free:
@@ -134,7 +134,7 @@ class Map:
         else:
             raise ValueError(f"Unknown type type {tile_type} at x: {new_x}, y: {new_y}")
 
-    def _wrap_around(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, Tile]:
+    def _wrap_around(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, int]:
         if self.wrap_type == WrapType.Map:
             return self._wrap_around_map(x, y, direction)
         else:
@@ -145,7 +145,7 @@ class Map:
             else:
                 raise ValueError(f"Unknown cube layout {self.cube_layout}")
 
-    def _wrap_around_map(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, Tile]:
+    def _wrap_around_map(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, int]:
         step_x, step_y = direction.get_steps()
         tile_type = Tile.Free
         while tile_type != Tile.Void:
@@ -154,7 +154,7 @@ class Map:
             tile_type = self._get_type(x, y)
         return x + step_x, y + step_y, direction, self._get_type(x + step_x, y + step_y)
 
-    def _wrap_around_cube_layout_0(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, Tile]:
+    def _wrap_around_cube_layout_0(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, int]:
         face = self._get_face_id(x, y)
         face_length = self._get_face_length()
         face_x = x % face_length
@@ -220,7 +220,7 @@ class Map:
 
         return target_x, target_y, target_direction, self._get_type(target_x, target_y)
 
-    def _wrap_around_cube_layout_1(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, Tile]:
+    def _wrap_around_cube_layout_1(self, x: int, y: int, direction: Direction) -> Tuple[int, int, Direction, int]:
         face = self._get_face_id(x, y)
         face_length = self._get_face_length()
         face_x = x % face_length
@@ -346,49 +346,45 @@ class Map:
 
     def _get_face_length(self) -> int:
         if self.cube_layout == 0:
-            return len(self.tiles) // 3
+            return self.tiles.height // 3
         elif self.cube_layout == 1:
-            return len(self.tiles) // 4
+            return self.tiles.height // 4
         else:
             raise ValueError(f"Unknown cube layout {self.cube_layout}")
 
-    def _get_type(self, x: int, y: int) -> Tile:
-        if y < 0 or y >= len(self.tiles):
-            return Tile.Void
-
-        tiles = self.tiles[y]
-        if x < 0 or x >= len(tiles):
-            return Tile.Void
-
-        return tiles[x]
+    def _get_type(self, x: int, y: int) -> int:
+        return self.tiles.get(x, y, Tile.Void)
 
     @staticmethod
     def _calc_password(x: int, y: int, direction: Direction) -> int:
         return 1000 * (y + 1) + (x + 1) * 4 + direction.value
 
     def _find_start_x(self) -> int:
-        return self.tiles[0].index(Tile.Free)
+        return self.tiles.row(0).index(Tile.Free)
 
     def print_path(self):
-        for y in range(len(self.tiles)):
-            tiles = self.tiles[y]
+        for y in range(self.tiles.height):
             line = ""
-            for x in range(len(tiles)):
-                tile = tiles[x]
+            for x in range(self.tiles.width):
+                tile = self.tiles[x, y]
                 if tile == Tile.Free:
-                    line += self.used_path[y][x]
-                elif tile == Tile.Void:
-                    line += " "
+                    line += chr(self.used_path[x, y])
                 else:
-                    line += "#"
+                    line += chr(tile)
             print(line)
 
 
+@timed("level22.parse_input_file")
 def parse_input_file(wrap_type: WrapType, cube_layout: int) -> Map:
-    lines = read_input_file(22, False)
-    return Map(wrap_type, lines, cube_layout)
+    return cached_parse(
+        22,
+        f"map-{wrap_type.name}-{cube_layout}",
+        PARSER_VERSION,
+        lambda: Map(wrap_type, read_input_file(22, False), cube_layout),
+    )
 
 
+@timed("level22.level22")
 def level22(wrap_type: WrapType, cube_layout: int = -1) -> int:
     field = parse_input_file(wrap_type, cube_layout)
     password = field.get_password()
@@ -2,10 +2,11 @@ from collections import defaultdict
 from enum import Enum
 from typing import List, Tuple, Dict, Any
 
+from util.coordinates import NEIGHBOURS_8, get_offsets, get_stride, unpack
 from util.file_util import read_input_file
+from util.instrumentation import count, progress, timed
 
-
-POSITION_ID_KEY = 10000
+MAX_ROUNDS = 5000
 
 
 class Direction(Enum):
@@ -15,14 +16,18 @@ class Direction(Enum):
     East = 3
 
 
-def get_position_id(x: int, y: int) -> int:
-    return x + y * POSITION_ID_KEY
+def get_position_id(x: int, y: int, stride: int) -> int:
+    # pack without its range check, get_board_stride leaves room for every x an elf can reach
+    return y * stride + x
+
 
+def get_coordinates(position_id: int, stride: int) -> Tuple[int, int]:
+    return unpack(position_id, stride)
 
-def get_coordinates(position_id: int) -> Tuple[int, int]:
-    y = position_id // POSITION_ID_KEY
-    x = position_id - y * POSITION_ID_KEY
-    return x, y
+
+def get_board_stride(width: int) -> int:
+    # an elf moves at most one step per round, so x stays within -MAX_ROUNDS .. width + MAX_ROUNDS
+    return get_stride(width + MAX_ROUNDS)
 
 
 class Elf:
@@ -33,20 +38,22 @@ class Elf:
         self.x = x
         self.y = y
 
-    def get_position_id(self) -> int:
-        return get_position_id(self.x, self.y)
+    def get_position_id(self, stride: int) -> int:
+        return get_position_id(self.x, self.y, stride)
 
     def get_movement_proposal(
-        self, elves: Dict[int, Any], direction_check_order: List[Direction]
+        self, elves: Dict[int, Any], direction_check_order: List[Direction], stride: int, offsets: List[int]
     ) -> Tuple[int | None, int | None]:
-        nw_free = get_position_id(self.x - 1, self.y - 1) not in elves
-        n_free = get_position_id(self.x, self.y - 1) not in elves
-        ne_free = get_position_id(self.x + 1, self.y - 1) not in elves
-        w_free = get_position_id(self.x - 1, self.y) not in elves
-        e_free = get_position_id(self.x + 1, self.y) not in elves
-        sw_free = get_position_id(self.x - 1, self.y + 1) not in elves
-        s_free = get_position_id(self.x, self.y + 1) not in elves
-        se_free = get_position_id(self.x + 1, self.y + 1) not in elves
+        nw, n, ne, w, e, sw, s, se = offsets
+        position_id = self.get_position_id(stride)
+        nw_free = position_id + nw not in elves
+        n_free = position_id + n not in elves
+        ne_free = position_id + ne not in elves
+        w_free = position_id + w not in elves
+        e_free = position_id + e not in elves
+        sw_free = position_id + sw not in elves
+        s_free = position_id + s not in elves
+        se_free = position_id + se not in elves
 
         if nw_free and n_free and ne_free and w_free and e_free and sw_free and s_free and se_free:
             return None, None
@@ -83,15 +90,18 @@ Elves = Dict[int, Elf]
 MovementProposal = Dict[int, List[Elf]]
 
 
-def parse_input_file() -> Elves:
+@timed("level23.parse_input_file")
+def parse_input_file() -> Tuple[Elves, int]:
+    # the elves by packed position and the stride of the packing
     lines = read_input_file(23)
+    stride = get_board_stride(max(map(len, lines), default=0))
     elves: Elves = {}
     for y in range(len(lines)):
         for x in range(len(lines[y])):
             if lines[y][x] == "#":
-                elf = Elf(x + POSITION_ID_KEY // 2, y + POSITION_ID_KEY // 2)
-                elves[elf.get_position_id()] = elf
-    return elves
+                elf = Elf(x, y)
+                elves[elf.get_position_id(stride)] = elf
+    return elves, stride
 
 
 def get_covered_area_dimensions(elves: Elves) -> Tuple[int, int, int, int]:
@@ -111,29 +121,32 @@ def get_covered_area(elves: Elves) -> int:
     return len_x * len_y - len(elves)
 
 
-def print_area(elves: Elves):
+def print_area(elves: Elves, stride: int):
     min_x, max_x, min_y, max_y = get_covered_area_dimensions(elves)
     for y in range(min_y, max_y + 1):
         line = ""
         for x in range(min_x, max_x + 1):
-            line += "#" if get_position_id(x, y) in elves else "."
+            line += "#" if get_position_id(x, y, stride) in elves else "."
         print(line)
 
 
-def propose_movements(elves: Elves, direction_check_order: List[Direction]) -> [MovementProposal, List[Elf]]:
+def propose_movements(
+    elves: Elves, direction_check_order: List[Direction], stride: int
+) -> [MovementProposal, List[Elf]]:
+    offsets = get_offsets(NEIGHBOURS_8, stride)
     movement_proposals: MovementProposal = defaultdict(list)
     not_moved_elves = []
     for elf in elves.values():
-        x, y = elf.get_movement_proposal(elves, direction_check_order)
+        x, y = elf.get_movement_proposal(elves, direction_check_order, stride, offsets)
         if x is None:
             not_moved_elves.append(elf)
         else:
-            movement_proposals[get_position_id(x, y)].append(elf)
+            movement_proposals[get_position_id(x, y, stride)].append(elf)
     return movement_proposals, not_moved_elves
 
 
-def move_elves(elves: Elves, direction_check_order: List[Direction]) -> Tuple[Elves, bool]:
-    movement_proposals, not_moved_elves = propose_movements(elves, direction_check_order)
+def move_elves(elves: Elves, direction_check_order: List[Direction], stride: int) -> Tuple[Elves, bool]:
+    movement_proposals, not_moved_elves = propose_movements(elves, direction_check_order, stride)
     new_elves: Elves = {}
 
     for movement_proposal_id in movement_proposals:
@@ -141,21 +154,23 @@ def move_elves(elves: Elves, direction_check_order: List[Direction]) -> Tuple[El
         if len(movement_proposal) == 1:
             elf = movement_proposal[0]
             new_elves[movement_proposal_id] = elf
-            x, y = get_coordinates(movement_proposal_id)
+            x, y = get_coordinates(movement_proposal_id, stride)
             elf.x = x
             elf.y = y
         else:
             for elf in movement_proposal:
-                new_elves[elf.get_position_id()] = elf
+                new_elves[elf.get_position_id(stride)] = elf
 
     for elf in not_moved_elves:
-        new_elves[elf.get_position_id()] = elf
+        new_elves[elf.get_position_id(stride)] = elf
 
+    count("level23.proposals", len(movement_proposals))
     return new_elves, len(movement_proposals) == 0
 
 
+@timed("level23.level23")
 def level23() -> Tuple[int, int]:
-    elves = parse_input_file()
+    elves, stride = parse_input_file()
     round_10_result = -1
     direction_check_order = [
         Direction.North,
@@ -164,11 +179,9 @@ def level23() -> Tuple[int, int]:
         Direction.East,
     ]
 
-    for i in range(5000):
-        if i > 50 and i % 100 == 0:
-            print(f"Iteration {i}", flush=True)
-
-        elves, finished = move_elves(elves, direction_check_order)
+    for i in range(MAX_ROUNDS):
+        progress("level23.rounds", i)
+        elves, finished = move_elves(elves, direction_check_order, stride)
         direction_check_order.append(direction_check_order.pop(0))
 
         if i == 9:
@@ -177,7 +190,7 @@ def level23() -> Tuple[int, int]:
         if finished:
             return round_10_result, i + 1
 
-    raise ValueError("Couldn't find result in 5000 iterations")
+    raise ValueError(f"Couldn't find result in {MAX_ROUNDS} iterations")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,13 @@
 from enum import Enum
-from typing import List, Tuple, Set
+from math import lcm
+from typing import List, Tuple
 
+from util.cache import cached_parse
 from util.file_util import read_input_file
+from util.instrumentation import count, timed
+from util.search import layered_grid_search
+
+PARSER_VERSION = 4
 
 
 class Movement(Enum):
@@ -29,82 +35,91 @@ FieldDimensions = Tuple[int, int]
 Coordinate = Tuple[int, int]
 
 
+def rotate(row: int, shift: int, width: int) -> int:
+    # moves the bits of a width bit row up by shift, the bits falling off the top come back at the bottom
+    shift %= width
+    return ((row << shift) | (row >> (width - shift))) & ((1 << width) - 1)
+
+
 class Field:
+    # Rows are bitmasks over the columns inside the walls, bit x is column x + 1 of the map. Nothing is stored
+    # per minute, the blizzards of any minute come from rotating the rows of the horizontal blizzards and
+    # picking other rows for the vertical ones.
     start: Tuple[int, int]
     end: Tuple[int, int]
-    blizzards: List[Set[Tuple[int, int]]]
-    walls: Set[Tuple[int, int]]
     width: int
     height: int
+    inner_width: int
+    inner_height: int
+    period: int  # the blizzards repeat after this many minutes
+    blizzards_left: List[int]
+    blizzards_right: List[int]
+    blizzards_up: List[int]
+    blizzards_down: List[int]
 
     def __init__(self, lines: List[str]):
         self.start = 1, 0
         self.end = len(lines[0]) - 2, len(lines) - 1
-        self.blizzards = []
-        self.walls = set()
         self.width = len(lines[0])
         self.height = len(lines)
-
-        directions = [m.value for m in Movement]
-        blizzards = []
-        for y in range(self.height):
-            for x in range(self.width):
-                if lines[y][x] == "#":
-                    self.walls.add((x, y))
-                elif lines[y][x] in directions:
-                    blizzards.append((x, y, Movement(lines[y][x])))
-
-        for minute in range(1000):
-            self.blizzards.append(set())
-
-        for blizzard in blizzards:
-            x = blizzard[0] - 1
-            y = blizzard[1] - 1
-            for minute in range(1000):
-                self.blizzards[minute].add((x + 1, y + 1))
-                movement = blizzard[2].get_movement()
-                x = (x + movement[0]) % (self.width - 2)
-                y = (y + movement[1]) % (self.height - 2)
-
-    def get_possible_movements(self, x: int, y: int, minute: int):
-        movements = []
-        for movement in Movement:
-            x_plus, y_plus = movement.get_movement()
-            check_x = x + x_plus
-            check_y = y + y_plus
-            position = (check_x, check_y)
-            if 0 <= check_y < self.height and position not in self.blizzards[minute] and position not in self.walls:
-                movements.append(movement)
-        return movements
+        self.inner_width = self.width - 2
+        self.inner_height = self.height - 2
+        self.period = lcm(self.inner_width, self.inner_height)
+
+        rows = {movement: [0] * self.inner_height for movement in Movement if movement != Movement.Wait}
+        for y in range(self.inner_height):
+            for x in range(self.inner_width):
+                char = lines[y + 1][x + 1]
+                if char in "^v<>":
+                    rows[Movement(char)][y] |= 1 << x
+        self.blizzards_left = rows[Movement.Left]
+        self.blizzards_right = rows[Movement.Right]
+        self.blizzards_up = rows[Movement.Up]
+        self.blizzards_down = rows[Movement.Down]
+
+    def get_blizzard_row(self, y: int, minute: int) -> int:
+        # a blizzard moving up is in row y at this minute if it started minute rows further down, and so on
+        return (
+            rotate(self.blizzards_left[y], -minute, self.inner_width)
+            | rotate(self.blizzards_right[y], minute, self.inner_width)
+            | self.blizzards_up[(y + minute) % self.inner_height]
+            | self.blizzards_down[(y - minute) % self.inner_height]
+        )
+
+    def get_entrance_cell(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        # the cell inside the walls next to the start or the end, as (bit, row)
+        if position == self.start:
+            return 0, 0
+        if position == self.end:
+            return self.inner_width - 1, self.inner_height - 1
+        raise ValueError(f"{position} is neither the start nor the end")
 
     def get_distance_to_end(self, x: int, y: int):
         return abs(x - self.end[0]) + abs(y - self.end[1])
 
 
+@timed("level24.parse_input_file")
 def parse_input_file() -> Field:
-    lines = read_input_file(24)
-    return Field(lines)
+    return cached_parse(24, "field", PARSER_VERSION, lambda: Field(read_input_file(24)))
 
 
 def level24_trip(field: Field, start: Tuple[int, int, int], end: Tuple[int, int]) -> int:
-    todo = [start]
-    todo_set = {start}
-    i = 0
-    while i < 10000000 and len(todo) != 0:
-        position = todo.pop(0)
-        if position[0] == end[0] and position[1] == end[1]:
-            return position[2]
-        possible_movements = field.get_possible_movements(position[0], position[1], position[2] + 1)
-        for movement in possible_movements:
-            delta = movement.get_movement()
-            todo_entry = (position[0] + delta[0], position[1] + delta[1], position[2] + 1)
-            if todo_entry not in todo_set:
-                todo.append(todo_entry)
-                todo_set.add(todo_entry)
-        i += 1
-    raise ValueError("Couldn't find exit!")
-
-
+    # Waiting at the start is always possible, so its cell inside the walls can be entered at any minute.
+    # The end is reached one minute after its cell is.
+    minute = layered_grid_search(
+        field.inner_width,
+        field.inner_height,
+        [field.get_entrance_cell((start[0], start[1]))],
+        field.get_entrance_cell(end),
+        field.get_blizzard_row,
+        field.period,
+        start[2],
+    )
+    count("level24.searched_minutes", minute - start[2])
+    return minute + 1
+
+
+@timed("level24.level24")
 def level24() -> Tuple[int, int]:
     field = parse_input_file()
     minutes_trip_1 = level24_trip(field, (field.start[0], field.start[1], 0), field.end)
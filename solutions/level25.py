@@ -1,6 +1,7 @@
 from typing import Tuple
 
-from util.file_util import read_input_file
+from util.file_util import iterate_input_file
+from util.instrumentation import timed
 
 
 SNAFU_TO_DECIMAL = {
@@ -50,8 +51,9 @@ def decimal_to_base_5(decimal: int) -> int:
     return result
 
 
+@timed("level25.level25")
 def level25() -> Tuple[str, int]:
-    fuel_requirements = read_input_file(25)
+    fuel_requirements = iterate_input_file(25)
     sum_fuel_requirements = sum(map(snafu_to_decimal, fuel_requirements))
     return decimal_to_snafu(sum_fuel_requirements), 0
 
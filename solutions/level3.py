@@ -1,39 +1,62 @@
-from collections import Counter
-from typing import List, Set, Tuple
-from numpy import array_split
+from functools import reduce
+from operator import or_
+from string import ascii_lowercase, ascii_uppercase
+from typing import List, Tuple
 
 from util.file_util import read_input_file
+from util.instrumentation import timed
+
+# Item with priority p is bit p - 1, so the priority of a single item mask is its bit_length
+ITEMS = ascii_lowercase + ascii_uppercase
+ITEM_BITS = {item: 1 << i for i, item in enumerate(ITEMS)}
+
+
+def get_items_mask(items: str) -> int:
+    return reduce(or_, map(ITEM_BITS.__getitem__, items), 0)
 
 
 class Rucksack:
     content: str
     compartment1: str
     compartment2: str
+    compartment1_mask: int
+    compartment2_mask: int
 
     def __init__(self, content: str):
         compartment_length = int(len(content) / 2)
         self.content = content
         self.compartment1 = content[0:compartment_length]
         self.compartment2 = content[compartment_length:]
+        self.compartment1_mask = get_items_mask(self.compartment1)
+        self.compartment2_mask = get_items_mask(self.compartment2)
+
+    def get_mask(self) -> int:
+        return self.compartment1_mask | self.compartment2_mask
+
+    def get_wrong_item_mask(self) -> int:
+        wrong_items = self.compartment1_mask & self.compartment2_mask
+        if wrong_items == 0:
+            raise ValueError("Couldn't find a wrong item")
+        return wrong_items
 
     def find_wrong_item(self) -> str:
-        for item in self.compartment1:
-            if item in self.compartment2:
-                return item
-        raise ValueError("Couldn't find a wrong item")
+        return ITEMS[self.get_wrong_item_mask().bit_length() - 1]
 
 
+@timed("level3.parse_input_file1")
 def parse_input_file1() -> List[Rucksack]:
     lines = read_input_file(3)
     all_rucksacks = list(map(Rucksack, lines))
     return all_rucksacks
 
 
+@timed("level3.parse_input_file2")
 def parse_input_file2() -> List[List[Rucksack]]:
-    lines = read_input_file(3)
-    all_rucksacks = list(map(Rucksack, lines))
-    rucksack_groups = array_split(all_rucksacks, len(all_rucksacks) / 3)
-    return rucksack_groups
+    return group_rucksacks(parse_input_file1())
+
+
+def group_rucksacks(rucksacks: List[Rucksack]) -> List[List[Rucksack]]:
+    return [rucksacks[i:i + 3] for i in range(0, len(rucksacks), 3)]
 
 
 def get_item_priority(item: str) -> int:
@@ -44,28 +67,22 @@ def get_item_priority(item: str) -> int:
         return i - (65 - 27)
 
 
-def rucksack2set(rucksack: Rucksack) -> Set[str]:
-    content = set()
-    for character in rucksack.content:
-        content.add(character)
-    return content
+def get_badge_mask(rucksacks: List[Rucksack]) -> int:
+    badges = reduce(lambda mask, rucksack: mask & rucksack.get_mask(), rucksacks, -1)
+    if badges <= 0:
+        raise ValueError("Couldn't find a badge")
+    return badges
 
 
 def find_badge(rucksacks: List[Rucksack]) -> str:
-    contents = list(map(lambda rucksack: Counter(rucksack2set(rucksack)), rucksacks))
-    overlap = list((contents[0] & contents[1] & contents[2]).elements())
-    return overlap[0]
+    return ITEMS[get_badge_mask(rucksacks).bit_length() - 1]
 
 
+@timed("level3.level3")
 def level3() -> Tuple[int, int]:
-    rucksacks1 = parse_input_file1()
-    wrong_items = map(Rucksack.find_wrong_item, rucksacks1)
-    wrong_item_priorities = map(get_item_priority, wrong_items)
-
-    rucksacks2 = parse_input_file2()
-    badges = map(find_badge, rucksacks2)
-    badges_priorities = map(get_item_priority, badges)
-
+    rucksacks = parse_input_file1()
+    wrong_item_priorities = (rucksack.get_wrong_item_mask().bit_length() for rucksack in rucksacks)
+    badges_priorities = (get_badge_mask(group).bit_length() for group in group_rucksacks(rucksacks))
     return sum(wrong_item_priorities), sum(badges_priorities)
 
 
@@ -1,6 +1,11 @@
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
-from util.file_util import read_input_file
+from util.file_util import iterate_input_file, map_or_stream_input_file
+from util.instrumentation import timed
+from util.intervals import IntervalTree
+from util.numpy_util import iterate_chunks, parse_integer_runs
+
+Columns = Tuple["ndarray", "ndarray", "ndarray", "ndarray"]
 
 
 class Assignments:
@@ -34,12 +39,31 @@ class Assignments:
         return not is_1_before_2 and not is_2_before_1
 
 
+class AssignmentIndex:
+    # answers which pairs have an assignment covering a section or overlapping a range, by pair index
+    tree: IntervalTree
+
+    def __init__(self, assignments: List[Assignments]):
+        intervals = []
+        for i, assignment in enumerate(assignments):
+            intervals.append((assignment.assignment_1_left, assignment.assignment_1_right, i))
+            intervals.append((assignment.assignment_2_left, assignment.assignment_2_right, i))
+        self.tree = IntervalTree(intervals)
+
+    def get_covering_pairs(self, section: int) -> List[int]:
+        return sorted(set(self.tree.stab(section)))
+
+    def get_overlapping_pairs(self, start: int, end: int) -> List[int]:
+        return sorted(set(self.tree.overlap(start, end)))
+
+
+@timed("level4.parse_input_file")
 def parse_input_file() -> List[Assignments]:
-    lines = read_input_file(4)
-    all_assignments = list(map(Assignments, lines))
+    all_assignments = list(map(Assignments, iterate_input_file(4)))
     return all_assignments
 
 
+@timed("level4.level4")
 def level4() -> Tuple[int, int]:
     assignments = parse_input_file()
     num_full_overlaps = sum(1 if assignment.does_fully_overlap() else 0 for assignment in assignments)
@@ -47,6 +71,44 @@ def level4() -> Tuple[int, int]:
     return num_full_overlaps, num_partly_overlaps
 
 
+def iterate_columns(buffer: bytes | Iterable[bytes]) -> Iterator[Columns]:
+    # the columns chunk by chunk, every chunk holds whole lines
+    for chunk in iterate_chunks(buffer):
+        yield get_columns(parse_integer_runs(chunk))
+
+
+def get_columns(values: "ndarray") -> Columns:
+    import numpy
+
+    if len(values) % 4 != 0:
+        raise ValueError("Every line needs exactly two assignments")
+    if len(values) > 0 and values.max() > numpy.iinfo(numpy.int32).max:
+        raise ValueError("Sections do not fit 32 bit")
+    left_1, right_1, left_2, right_2 = values.astype(numpy.int32).reshape(-1, 4).T
+    return left_1, right_1, left_2, right_2
+
+
+def count_overlaps(columns: Columns) -> Tuple[int, int]:
+    # the same conditions as Assignments.does_fully_overlap and does_partly_overlap
+    left_1, right_1, left_2, right_2 = columns
+    is_1_in_2 = (left_2 <= left_1) & (right_2 >= right_1)
+    is_2_in_1 = (left_1 <= left_2) & (right_1 >= right_2)
+    is_1_before_2 = (left_1 < left_2) & (right_1 < left_2)
+    is_2_before_1 = (left_2 < left_1) & (right_2 < left_1)
+    return int((is_1_in_2 | is_2_in_1).sum()), int((~is_1_before_2 & ~is_2_before_1).sum())
+
+
+@timed("level4.level4_columnar")
+def level4_columnar() -> Tuple[int, int]:
+    num_full_overlaps = num_partly_overlaps = 0
+    with map_or_stream_input_file(4) as buffer:
+        for columns in iterate_columns(buffer):
+            chunk_full_overlaps, chunk_partly_overlaps = count_overlaps(columns)
+            num_full_overlaps += chunk_full_overlaps
+            num_partly_overlaps += chunk_partly_overlaps
+    return num_full_overlaps, num_partly_overlaps
+
+
 if __name__ == '__main__':
     _num_full_overlaps, _num_partly_overlaps = level4()
     print(f"Numbers of full overlaps: {_num_full_overlaps}")
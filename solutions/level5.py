@@ -1,6 +1,8 @@
-from typing import List, Tuple
+from random import random
+from typing import Iterable, Iterator, List, Tuple
 
 from util.file_util import read_input_file
+from util.instrumentation import timed
 
 
 class Command:
@@ -15,11 +17,202 @@ class Command:
         self.move_to = int(parts[5]) - 1
 
 
+CHUNK_SIZE = 1024
+
+
+class CrateNode:
+    __slots__ = ("crates", "priority", "size", "reversed", "left", "right")
+    crates: List[str]  # a chunk of the stack, bottom to top
+    priority: float
+    size: int
+    reversed: bool  # the subtree below still has to be mirrored
+    left: "CrateNode | None"
+    right: "CrateNode | None"
+
+    def __init__(self, crates: List[str], priority: float | None = None):
+        self.crates = crates
+        self.priority = random() if priority is None else priority
+        self.size = len(crates)
+        self.reversed = False
+        self.left = self.right = None
+
+
+def get_size(node: CrateNode | None) -> int:
+    return node.size if node is not None else 0
+
+
+def push_down(node: CrateNode):
+    if node.reversed:
+        node.left, node.right = node.right, node.left
+        for child in (node.left, node.right):
+            if child is not None:
+                child.reversed = not child.reversed
+        node.crates.reverse()
+        node.reversed = False
+
+
+def update_size(node: CrateNode):
+    node.size = len(node.crates) + get_size(node.left) + get_size(node.right)
+
+
+def split_nodes(node: CrateNode | None, count: int) -> Tuple[CrateNode | None, CrateNode | None]:
+    # the first count crates and the rest, the recursion is as deep as the treap
+    if node is None:
+        return None, None
+    push_down(node)
+    left_size = get_size(node.left)
+    if count <= left_size:
+        first, node.left = split_nodes(node.left, count)
+        update_size(node)
+        return first, node
+    if count >= left_size + len(node.crates):
+        node.right, rest = split_nodes(node.right, count - left_size - len(node.crates))
+        update_size(node)
+        return node, rest
+
+    # the split runs through this chunk, the second half keeps the priority to stay above the right subtree
+    cut = count - left_size
+    rest = CrateNode(node.crates[cut:], node.priority)
+    rest.right = node.right
+    update_size(rest)
+    node.crates = node.crates[:cut]
+    node.right = None
+    update_size(node)
+    return node, rest
+
+
+def merge_nodes(first: CrateNode | None, second: CrateNode | None) -> CrateNode | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if first.priority > second.priority:
+        push_down(first)
+        first.right = merge_nodes(first.right, second)
+        update_size(first)
+        return first
+    push_down(second)
+    second.left = merge_nodes(first, second.left)
+    update_size(second)
+    return second
+
+
+def build_nodes(crates: Iterable[str]) -> CrateNode | None:
+    # builds the treap in O(n) along its right spine, a node is complete once it leaves the spine
+    crates = list(crates)
+    spine: List[CrateNode] = []
+    for start in range(0, len(crates), CHUNK_SIZE):
+        node = CrateNode(crates[start:start + CHUNK_SIZE])
+        last = None
+        while spine and spine[-1].priority < node.priority:
+            last = spine.pop()
+            update_size(last)
+        node.left = last
+        if spine:
+            spine[-1].right = node
+        spine.append(node)
+    while len(spine) > 1:
+        update_size(spine.pop())
+    if not spine:
+        return None
+    update_size(spine[0])
+    return spine[0]
+
+
+class CrateStack:
+    # an implicit treap over chunks of crates, splitting and concatenating stacks takes O(log n + CHUNK_SIZE)
+    # and reversing O(1)
+    root: CrateNode | None
+
+    def __init__(self, crates: Iterable[str] = ()):
+        self.root = build_nodes(crates)
+
+    def __len__(self) -> int:
+        return get_size(self.root)
+
+    def __iter__(self) -> Iterator[str]:
+        # bottom to top
+        todo: List[CrateNode] = []
+        node = self.root
+        while todo or node is not None:
+            while node is not None:
+                push_down(node)
+                todo.append(node)
+                node = node.left
+            node = todo.pop()
+            yield from node.crates
+            node = node.right
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Stack has no crate {index}")
+        node = self.root
+        while True:
+            push_down(node)
+            left_size = get_size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index < left_size + len(node.crates):
+                return node.crates[index - left_size]
+            else:
+                index -= left_size + len(node.crates)
+                node = node.right
+
+    def __iadd__(self, other: "CrateStack"):
+        # moves the crates of other on top of this stack
+        self.root = merge_nodes(self.root, other.root)
+        other.root = None
+        return self
+
+    def split_top(self, amount: int) -> "CrateStack":
+        top = CrateStack()
+        self.root, top.root = split_nodes(self.root, len(self) - amount)
+        return top
+
+    def reverse(self):
+        if self.root is not None:
+            self.root.reversed = not self.root.reversed
+
+    def get_top(self) -> str:
+        return self[-1]
+
+
 class Cargo:
-    stacks: List[List[str]]
+    stacks: List[List[str]] | List[CrateStack]
+    deep: bool  # stacks are CrateStacks, so moves do not copy crates
+
+    def __init__(self, crates: List[List[str]] | List[CrateStack], deep: bool = False):
+        self.deep = deep
+        self.stacks = [CrateStack(stack) for stack in crates] if deep else crates
+
+    def copy(self):
+        if self.deep:
+            return Cargo([list(stack) for stack in self.stacks], True)
+        return Cargo([stack.copy() for stack in self.stacks])
+
+    def move(self, command: Command, reverse: bool):
+        # the CrateMover 9000 moves one crate at a time, which reverses the moved crates
+        source = self.stacks[command.move_from]
+        if command.amount > len(source):
+            raise ValueError(f"Cannot move {command.amount} crates from a stack of {len(source)}")
+        if self.deep:
+            crates = source.split_top(command.amount)
+        else:
+            split = len(source) - command.amount
+            crates = source[split:]
+            del source[split:]
+        if reverse:
+            crates.reverse()
+        self.stacks[command.move_to] += crates
+
+    def execute(self, commands: List[Command], reverse: bool):
+        for command in commands:
+            self.move(command, reverse)
 
-    def __init__(self, crates: List[List[str]]):
-        self.stacks = crates
+    def get_top_items(self) -> str:
+        return "".join(map(get_top, self.stacks))
 
 
 def revert_stacks(in_stacks: List[List[str]]) -> List[List[str]]:
@@ -30,7 +223,8 @@ def revert_stacks(in_stacks: List[List[str]]) -> List[List[str]]:
     return stacks
 
 
-def parse_input_file() -> Tuple[Cargo, List[Command]]:
+@timed("level5.parse_input_file")
+def parse_input_file(deep: bool = False) -> Tuple[Cargo, List[Command]]:
     lines = read_input_file(5, False)
     num_crates = int((len(lines[0]) + 1) / 4)
     all_commands: List[Command] = []
@@ -51,32 +245,20 @@ def parse_input_file() -> Tuple[Cargo, List[Command]]:
 
     stacks = revert_stacks(temp_stacks)
 
-    return Cargo(stacks), all_commands
+    return Cargo(stacks, deep), all_commands
 
 
 def get_top(_stack: List[str]) -> str:
     return _stack[-1]
 
 
-def level5() -> Tuple[str, str]:
-    cargo1, commands = parse_input_file()
-    for command in commands:
-        for _ in range(command.amount):
-            character = cargo1.stacks[command.move_from].pop()
-            cargo1.stacks[command.move_to].append(character)
-
-    cargo2, commands = parse_input_file()
-    for command in commands:
-        temp_stack: List[str] = []
-        for _ in range(command.amount):
-            character = cargo2.stacks[command.move_from].pop()
-            temp_stack.append(character)
-        for _ in range(command.amount):
-            cargo2.stacks[command.move_to].append(temp_stack.pop())
-
-    top_items_1 = ''.join(list(map(get_top, cargo1.stacks)))
-    top_items_2 = ''.join(list(map(get_top, cargo2.stacks)))
-    return top_items_1, top_items_2
+@timed("level5.level5")
+def level5(deep: bool = False) -> Tuple[str, str]:
+    cargo1, commands = parse_input_file(deep)
+    cargo2 = cargo1.copy()
+    cargo1.execute(commands, True)
+    cargo2.execute(commands, False)
+    return cargo1.get_top_items(), cargo2.get_top_items()
 
 
 if __name__ == '__main__':
@@ -1,38 +1,45 @@
-from typing import List, Tuple
-
-from util.file_util import read_input_file
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from util.file_util import iterate_input_file_chunks
+from util.instrumentation import timed
+
+
+def find_signal_starts(chunks: Iterable[bytes], window_sizes: List[int]) -> Dict[int, int]:
+    # The characters since run_start are all distinct, so a window of size k fits as soon as the run is k long.
+    # One pass answers every window size, the chunks are never joined.
+    pending = sorted(set(window_sizes))
+    signal_starts: Dict[int, int] = {}
+    if not pending:
+        return signal_starts
+    last_seen = [-1] * 256
+    run_start = 0
+    position = 0
+    for chunk in chunks:
+        for char in chunk:
+            if last_seen[char] >= run_start:
+                run_start = last_seen[char] + 1
+            last_seen[char] = position
+            position += 1
+            while position - run_start >= pending[0]:
+                signal_starts[pending.pop(0)] = position
+                if not pending:
+                    return signal_starts
+    raise ValueError("Couldn't find start signal!")
 
 
-def is_all_distinct(characters: List[int]) -> bool:
-    char_set = set()
-    for c in characters:
-        if c in char_set:
-            return False
-        else:
-            char_set.add(c)
-    return True
+def find_signal_start(text: str, num_characters: int) -> int:
+    return find_signal_starts([text.encode()], [num_characters])[num_characters]
 
 
-def find_signal_start(text: str, num_characters: int) -> int:
-    c = []
-    for i in range(num_characters):
-        c.append(text[i])
-    i = num_characters - 1
-    while i < len(text):
-        c[num_characters - 1] = text[i]
-        if is_all_distinct(c):
-            return i + 1
-        for j in range(num_characters - 1):
-            c[j] = c[j + 1]
-        i += 1
-    raise ValueError("Couldn't find start signal!")
+def iterate_signal_chunks() -> Iterator[bytes]:
+    for chunk in iterate_input_file_chunks(6):
+        yield chunk.translate(None, b"\r\n")
 
 
+@timed("level6.level6")
 def level6() -> Tuple[int, int]:
-    signal_buffer = read_input_file(6)[0]
-    signal_start4 = find_signal_start(signal_buffer, 4)
-    signal_start14 = find_signal_start(signal_buffer, 14)
-    return signal_start4, signal_start14
+    signal_starts = find_signal_starts(iterate_signal_chunks(), [4, 14])
+    return signal_starts[4], signal_starts[14]
 
 
 if __name__ == '__main__':
@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import List, Dict, Tuple
+from typing import Iterable, Iterator, List, Dict, Tuple
 
-from util.file_util import read_input_file
+from util.file_util import STDIN_SOURCE, get_input_source, iterate_input_file, read_input_file
+from util.instrumentation import timed
 
 
 class Item:
@@ -25,14 +26,46 @@ class File(Item):
 class Directory(Item):
     name: str
     items: Dict[str, Item]
+    size: int | None  # total of the subtree, None while invalidated
 
     def __init__(self, parent, name: str):
         self.parent = parent
         self.name = name
         self.items = {}
+        self.size = 0
 
     def get_size(self) -> int:
-        return sum(map(lambda item: item.get_size(), self.items.values()))
+        if self.size is None:
+            self.update_sizes()
+        return self.size
+
+    def update_sizes(self):
+        # only invalidated directories are visited, children are summed up before their parents
+        invalidated = []
+        todo = [self]
+        while todo:
+            directory = todo.pop()
+            invalidated.append(directory)
+            todo.extend(
+                item for item in directory.items.values() if isinstance(item, Directory) and item.size is None
+            )
+        for directory in reversed(invalidated):
+            directory.size = sum(
+                item.size if isinstance(item, Directory) else item.get_size() for item in directory.items.values()
+            )
+
+    def invalidate_size(self):
+        # the ancestors of an invalidated directory are invalidated already
+        directory = self
+        while directory is not None and directory.size is not None:
+            directory.size = None
+            directory = directory.parent
+
+    def add_size(self, size: int):
+        directory = self
+        while directory is not None and directory.size is not None:
+            directory.size += size
+            directory = directory.parent
 
     def get_parent(self):
         return self.parent
@@ -54,6 +87,11 @@ class Directory(Item):
         if name not in self.items:
             new_file = File(name, size)
             self.items[name] = new_file
+            self.add_size(size)
+
+    def remove_item(self, name: str):
+        del self.items[name]
+        self.invalidate_size()
 
 
 def change_dir(root: Directory, current_dir: Directory, command: List[str]) -> Directory:
@@ -76,6 +114,7 @@ def read_contents(current_dir: Directory, lines: List[str], i: int) -> int:
     return i
 
 
+@timed("level7.parse_input")
 def parse_input() -> Directory:
     lines = read_input_file(7)
     root = Directory(None, "/")
@@ -98,24 +137,83 @@ def parse_input() -> Directory:
 
 
 def get_all_directories(root: Directory) -> List[Directory]:
-    all_directories = [root]
-    for key in root.items:
-        item = root.items[key]
-        if isinstance(item, Directory):
-            all_directories.extend(get_all_directories(item))
+    # pre-order like the recursive walk, but without the recursion limit on deep trees
+    all_directories = []
+    todo = [root]
+    while todo:
+        directory = todo.pop()
+        all_directories.append(directory)
+        todo.extend(reversed([item for item in directory.items.values() if isinstance(item, Directory)]))
     return all_directories
 
 
+def iterate_directory_sizes(lines: Iterable[str]) -> Iterator[int]:
+    # Only the sizes along the current path are kept. A directory is finished when the transcript leaves it,
+    # its size is emitted then and added to its parent, the root comes last. Like any terminal log of a walk
+    # through the tree, the transcript has to list every directory once.
+    path_sizes: List[int] = []
+    for i, line in enumerate(lines):
+        if line.startswith("$ cd "):
+            name = line[5:]
+            if name == "/":
+                while len(path_sizes) > 1:
+                    yield close_directory(path_sizes)
+                if not path_sizes:
+                    path_sizes.append(0)
+            elif name == "..":
+                yield close_directory(path_sizes)
+            else:
+                path_sizes.append(0)
+        elif line.startswith("$"):
+            if line != "$ ls":
+                raise ValueError(f"Unknown command {line[2:]}, line {i + 1}")
+        elif line != "" and not line.startswith("dir "):
+            path_sizes[-1] += int(line.split(" ", 1)[0])
+    while path_sizes:
+        yield close_directory(path_sizes)
+
+
+def close_directory(path_sizes: List[int]) -> int:
+    size = path_sizes.pop()
+    if path_sizes:
+        path_sizes[-1] += size
+    return size
+
+
+MAX_SPACE = 70000000
+NEEDED_SPACE = 30000000
+SMALL_DIRECTORY_SIZE = 100000
+
+
+@timed("level7.level7_streaming")
+def level7_streaming() -> Tuple[int, int]:
+    # two passes over the input, the first one only to learn the used space, memory depends on the depth only
+    if get_input_source(7) == STDIN_SOURCE:
+        raise ValueError("The streaming mode reads the input twice, which stdin does not allow")
+    used_space = 0
+    for used_space in iterate_directory_sizes(iterate_input_file(7)):
+        pass
+    space_to_delete = used_space - (MAX_SPACE - NEEDED_SPACE)
+
+    level_1_size = 0
+    level_2_size = used_space
+    for size in iterate_directory_sizes(iterate_input_file(7)):
+        if size <= SMALL_DIRECTORY_SIZE:
+            level_1_size += size
+        if space_to_delete < size < level_2_size:
+            level_2_size = size
+    return level_1_size, level_2_size
+
+
+@timed("level7.level7")
 def level7() -> Tuple[int, int]:
     file_structure = parse_input()
     directories = get_all_directories(file_structure)
 
-    small_directories = list(filter(lambda item: item.get_size() <= 100000, directories))
+    small_directories = list(filter(lambda item: item.get_size() <= SMALL_DIRECTORY_SIZE, directories))
     level_1_size = sum(map(Directory.get_size, small_directories))
 
-    max_space = 70000000
-    needed_space = 30000000
-    usable_space = max_space - needed_space
+    usable_space = MAX_SPACE - NEEDED_SPACE
     used_space = file_structure.get_size()
     space_to_delete = used_space - usable_space
     big_directories = list(filter(lambda item: item.get_size() > space_to_delete, directories))
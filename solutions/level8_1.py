@@ -1,75 +1,99 @@
-from typing import List
-
 from util.file_util import read_input_file
+from util.grid import DIGITS, Grid
+from util.instrumentation import timed
 
 
-def parse_input() -> List[List[int]]:
+@timed("level8_1.parse_input")
+def parse_input() -> Grid:
     lines = read_input_file(8)
-    return list(map(lambda line: [int(char) for char in line], lines))
+    return Grid.from_lines(lines, DIGITS)
 
 
-def visible_from_left(tree_matrix: List[List[int]]) -> List[List[bool]]:
-    result: List[List[bool]] = list(map(lambda _line: list(map(lambda _: False, _line)), tree_matrix))
-    for i in range(len(tree_matrix)):
+def visible_from_left(trees: Grid) -> Grid:
+    result = Grid(trees.width, trees.height)
+    for y in range(trees.height):
         current_height = -1
-        for j in range(len(tree_matrix[i])):
-            if tree_matrix[i][j] > current_height:
-                result[i][j] = True
-                current_height = tree_matrix[i][j]
+        for index in range(trees.index(0, y), trees.index(trees.width, y)):
+            if trees.cells[index] > current_height:
+                result.cells[index] = 1
+                current_height = trees.cells[index]
     return result
 
 
-def visible_from_right(tree_matrix: List[List[int]]) -> List[List[bool]]:
-    result: List[List[bool]] = list(map(lambda _line: list(map(lambda _: False, _line)), tree_matrix))
-    for i in range(len(tree_matrix)):
+def visible_from_right(trees: Grid) -> Grid:
+    result = Grid(trees.width, trees.height)
+    for y in range(trees.height):
         current_height = -1
-        for j in reversed(range(len(tree_matrix[i]))):
-            if tree_matrix[i][j] > current_height:
-                result[i][j] = True
-                current_height = tree_matrix[i][j]
+        for index in reversed(range(trees.index(0, y), trees.index(trees.width, y))):
+            if trees.cells[index] > current_height:
+                result.cells[index] = 1
+                current_height = trees.cells[index]
     return result
 
 
-def visible_from_top(tree_matrix: List[List[int]]) -> List[List[bool]]:
-    result: List[List[bool]] = list(map(lambda _line: list(map(lambda _: False, _line)), tree_matrix))
-    for j in range(len(tree_matrix[0])):
+def visible_from_top(trees: Grid) -> Grid:
+    result = Grid(trees.width, trees.height)
+    for x in range(trees.width):
         current_height = -1
-        for i in range(len(tree_matrix)):
-            if tree_matrix[i][j] > current_height:
-                result[i][j] = True
-                current_height = tree_matrix[i][j]
+        for index in range(x, len(trees.cells), trees.width):
+            if trees.cells[index] > current_height:
+                result.cells[index] = 1
+                current_height = trees.cells[index]
     return result
 
 
-def visible_from_bottom(tree_matrix: List[List[int]]) -> List[List[bool]]:
-    result: List[List[bool]] = list(map(lambda _line: list(map(lambda _: False, _line)), tree_matrix))
-    for j in range(len(tree_matrix[0])):
+def visible_from_bottom(trees: Grid) -> Grid:
+    result = Grid(trees.width, trees.height)
+    for x in range(trees.width):
         current_height = -1
-        for i in reversed(range(len(tree_matrix))):
-            if tree_matrix[i][j] > current_height:
-                result[i][j] = True
-                current_height = tree_matrix[i][j]
+        for index in reversed(range(x, len(trees.cells), trees.width)):
+            if trees.cells[index] > current_height:
+                result.cells[index] = 1
+                current_height = trees.cells[index]
     return result
 
 
+def mark_visible(heights: "ndarray", visible: "ndarray"):
+    # looking along the rows, a tree is visible when it is taller than every tree before it
+    import numpy
+
+    visible[:, 0] = True
+    visible[:, 1:] |= heights[:, 1:] > numpy.maximum.accumulate(heights[:, :-1], axis=1)
+
+
+def get_visible_mask(trees: Grid) -> "ndarray":
+    import numpy
+
+    heights = trees.to_numpy()
+    visible = numpy.zeros(heights.shape, dtype=bool)
+    mark_visible(heights, visible)
+    mark_visible(heights[:, ::-1], visible[:, ::-1])
+    # accumulating along rows is several times faster than along columns, so the columns are copied into rows
+    heights_t = numpy.ascontiguousarray(heights.T)
+    visible_t = numpy.zeros(heights_t.shape, dtype=bool)
+    mark_visible(heights_t, visible_t)
+    mark_visible(heights_t[:, ::-1], visible_t[:, ::-1])
+    return visible | visible_t.T
+
+
+@timed("level8_1.level8_1_batch")
+def level8_1_batch() -> int:
+    import numpy
+
+    trees = parse_input()
+    if trees.width == 0 or trees.height == 0:
+        return 0
+    return int(numpy.count_nonzero(get_visible_mask(trees)))
+
+
+@timed("level8_1.level8_1")
 def level8_1() -> int:
     trees = parse_input()
-    from_left = visible_from_left(trees)
-    from_right = visible_from_right(trees)
-    from_top = visible_from_top(trees)
-    from_bottom = visible_from_bottom(trees)
-
-    num_visible_trees = 0
-    visible_trees = []
-    for y in range(len(trees)):
-        visible_trees_line = ""
-        for x in range(len(trees[y])):
-            is_visible = (from_left[y][x] or from_right[y][x] or from_top[y][x] or from_bottom[y][x])
-            visible_trees_line += str(1) if is_visible else str(0)
-            if is_visible:
-                num_visible_trees += 1
-        visible_trees.append(visible_trees_line)
-    return num_visible_trees
+    visible = 0
+    for from_direction in [visible_from_left, visible_from_right, visible_from_top, visible_from_bottom]:
+        # every cell is 0 or 1, so OR-ing the byte strings as integers leaves one bit per visible tree
+        visible |= int.from_bytes(from_direction(trees).cells, "big")
+    return visible.bit_count()
 
 
 if __name__ == '__main__':
@@ -1,88 +1,137 @@
-from typing import List
+from heapq import nlargest
+from typing import Iterator, List, Sequence, Tuple
 
 from util.file_util import read_input_file
+from util.grid import DIGITS, Grid
+from util.instrumentation import timed
 
 
-def parse_input() -> List[List[int]]:
+@timed("level8_2.parse_input")
+def parse_input() -> Grid:
     lines = read_input_file(8)
-    return list(map(lambda line: [int(char) for char in line], lines))
+    return Grid.from_lines(lines, DIGITS)
 
 
-def sum_visible_to_top(tree_matrix: List[List[int]], y: int, x: int) -> int:
+def sum_visible_to_top(trees: Grid, y: int, x: int) -> int:
     if y == 0:
         return 0
 
     num_visible = 1
     check_y = y - 1
-    current_height = tree_matrix[y][x]
-    while check_y > 0 and current_height > tree_matrix[check_y][x]:
+    current_height = trees[x, y]
+    while check_y > 0 and current_height > trees[x, check_y]:
         num_visible += 1
         check_y -= 1
     return num_visible
 
 
-def sum_visible_to_bottom(tree_matrix: List[List[int]], y: int, x: int) -> int:
-    if y == len(tree_matrix) - 1:
+def sum_visible_to_bottom(trees: Grid, y: int, x: int) -> int:
+    if y == trees.height - 1:
         return 0
 
     num_visible = 1
     check_y = y + 1
-    current_height = tree_matrix[y][x]
-    while check_y < len(tree_matrix) - 1 and current_height > tree_matrix[check_y][x]:
+    current_height = trees[x, y]
+    while check_y < trees.height - 1 and current_height > trees[x, check_y]:
         num_visible += 1
         check_y += 1
     return num_visible
 
 
-def sum_visible_to_left(tree_matrix: List[List[int]], y: int, x: int) -> int:
+def sum_visible_to_left(trees: Grid, y: int, x: int) -> int:
     if x == 0:
         return 0
 
     num_visible = 1
     check_x = x - 1
-    current_height = tree_matrix[y][x]
-    while check_x > 0 and current_height > tree_matrix[y][check_x]:
+    current_height = trees[x, y]
+    while check_x > 0 and current_height > trees[check_x, y]:
         num_visible += 1
         check_x -= 1
     return num_visible
 
 
-def sum_visible_to_right(tree_matrix: List[List[int]], y: int, x: int) -> int:
-    if x == len(tree_matrix[y]) - 1:
+def sum_visible_to_right(trees: Grid, y: int, x: int) -> int:
+    if x == trees.width - 1:
         return 0
 
     num_visible = 1
     check_x = x + 1
-    current_height = tree_matrix[y][x]
-    while check_x < len(tree_matrix[y]) - 1 and current_height > tree_matrix[y][check_x]:
+    current_height = trees[x, y]
+    while check_x < trees.width - 1 and current_height > trees[check_x, y]:
         num_visible += 1
         check_x += 1
     return num_visible
 
 
-def calc_scenic_score(tree_matrix: List[List[int]], y: int, x: int) -> int:
-    to_top = sum_visible_to_top(tree_matrix, y, x)
-    to_bottom = sum_visible_to_bottom(tree_matrix, y, x)
-    to_left = sum_visible_to_left(tree_matrix, y, x)
-    to_right = sum_visible_to_right(tree_matrix, y, x)
+def calc_scenic_score(trees: Grid, y: int, x: int) -> int:
+    to_top = sum_visible_to_top(trees, y, x)
+    to_bottom = sum_visible_to_bottom(trees, y, x)
+    to_left = sum_visible_to_left(trees, y, x)
+    to_right = sum_visible_to_right(trees, y, x)
     return to_top * to_bottom * to_left * to_right
 
 
-def calc_scenic_scores(tree_matrix: List[List[int]]) -> List[List[int]]:
-    result: List[List[int]] = []
-    for i in range(len(tree_matrix)):
-        line: List[int] = []
-        for j in range(len(tree_matrix[i])):
-            line.append(calc_scenic_score(tree_matrix, i, j))
-        result.append(line)
-    return result
-
-
+def get_row_distances(heights: Sequence[int]) -> Tuple[List[int], List[int]]:
+    # viewing distances to the left and to the right of every tree in O(n). The monotonic stack holds the trees
+    # whose view to the right is still open, strictly decreasing in height, so at most one tree per height.
+    width = len(heights)
+    to_left = [0] * width
+    to_right = [0] * width
+    stack: List[int] = []
+    for x, height in enumerate(heights):
+        last = -1
+        while stack and heights[stack[-1]] <= height:
+            last = stack.pop()
+            to_right[last] = x - last
+        # the closest tree at least as tall is either the last popped one or the one left on the stack
+        if last >= 0 and heights[last] == height:
+            to_left[x] = x - last
+        else:
+            to_left[x] = x - stack[-1] if stack else x
+        stack.append(x)
+    for x in stack:
+        to_right[x] = width - 1 - x
+    return to_left, to_right
+
+
+def iterate_scenic_scores(trees: Grid) -> Iterator[Tuple[int, int, int]]:
+    # (score, x, y) of every tree, in the order the scores are complete. The rows are swept top to bottom and
+    # every column keeps a monotonic stack like the rows do, of (height, y, score without the view down).
+    columns: List[List[Tuple[int, int, int]]] = [[] for _ in range(trees.width)]
+    for y in range(trees.height):
+        heights = trees.row(y)
+        to_left, to_right = get_row_distances(heights)
+        for x, height in enumerate(heights):
+            stack = columns[x]
+            last = None
+            while stack and stack[-1][0] <= height:
+                last = stack.pop()
+                yield last[2] * (y - last[1]), x, last[1]
+            if last is not None and last[0] == height:
+                to_top = y - last[1]
+            else:
+                to_top = y - stack[-1][1] if stack else y
+            stack.append((height, y, to_top * to_left[x] * to_right[x]))
+    for x, stack in enumerate(columns):
+        for _, y, partial_score in stack:
+            yield partial_score * (trees.height - 1 - y), x, y
+
+
+def find_top_scenic_spots(trees: Grid, k: int) -> List[Tuple[int, int, int]]:
+    # the k best (score, x, y), equal scores keep the earlier tree in reading order
+    return nlargest(k, iterate_scenic_scores(trees), key=lambda spot: (spot[0], -spot[2], -spot[1]))
+
+
+@timed("level8_2.level8_2_top")
+def level8_2_top(k: int) -> List[Tuple[int, int, int]]:
+    return find_top_scenic_spots(parse_input(), k)
+
+
+@timed("level8_2.level8_2")
 def level8_2() -> int:
     trees = parse_input()
-    scenic_scores = calc_scenic_scores(trees)
-    max_scenic_score = max(map(lambda line: max(line), scenic_scores))
-    return max_scenic_score
+    return max((score for score, _, _ in iterate_scenic_scores(trees)), default=0)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,10 @@
-from typing import List, Set, Tuple
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
 
 from math_util import clamp
-from util.file_util import read_input_file
+from util.bitmap import TiledBitmap
+from util.coordinates import STRIDE, get_stride, pack, pack_unbounded, unpack
+from util.file_util import iterate_input_file
+from util.instrumentation import timed
 
 
 class Knot:
@@ -14,7 +17,7 @@ class Knot:
 
 class Rope:
     knots: List[Knot]
-    tail_positions: Set[str]
+    tail_positions: Set[int]
 
     def __init__(self, length: int):
         self.knots = [Knot() for _ in range(length)]
@@ -26,8 +29,7 @@ class Rope:
 
     def store_tail_position(self):
         tail = self.knots[-1]
-        position_id = f"{tail.x}-{tail.y}"
-        self.tail_positions.add(position_id)
+        self.tail_positions.add(pack_unbounded(tail.x, tail.y))
 
     def move_rope(self):
         for i in range(1, len(self.knots), 1):
@@ -72,21 +74,83 @@ class Movement:
             raise ValueError(f"Unknown direction {self.direction}")
 
 
-def parse_input() -> List[Movement]:
-    lines = read_input_file(9)
-    return list(map(Movement, lines))
+DIRECTIONS: Dict[str, Tuple[int, int]] = {"U": (0, 1), "D": (0, -1), "R": (1, 0), "L": (-1, 0)}
 
 
-def level9(movements: List[Movement]) -> Tuple[int, int]:
-    rope_2 = Rope(2)
-    for movement in movements:
-        movement.execute(rope_2)
+def count_tail_positions(movements: Iterable[Movement], lengths: Sequence[int], tiled: bool = False) -> List[int]:
+    # A shorter rope moves exactly like the front of a longer one, so only the longest rope is simulated and the
+    # tail of every requested length is one of its knots. The knots live in two int lists instead of objects.
+    # tiled keeps the visited positions in TiledBitmaps, which take far less memory than sets on long runs.
+    for length in lengths:
+        if length < 1:
+            raise ValueError(f"A rope needs at least one knot, not {length}")
+    num_knots = max(lengths, default=1)
+    stride = STRIDE
+    xs = [0] * num_knots
+    ys = [0] * num_knots
+    tail_positions: List[Set[int] | TiledBitmap | None] = [None] * num_knots
+    for length in lengths:
+        if tail_positions[length - 1] is None:
+            tail_positions[length - 1] = TiledBitmap() if tiled else set()
+        add_position(tail_positions[length - 1], 0, 0, stride)
 
-    rope_10 = Rope(10)
+    head_positions = tail_positions[0]
     for movement in movements:
-        movement.execute(rope_10)
+        if movement.direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction {movement.direction}")
+        step_x, step_y = DIRECTIONS[movement.direction]
+        # No knot gets further from the start than the head, so the packed sets only need a bigger stride once the
+        # head could leave the current one. The stride at least doubles each time, which keeps re-packing linear.
+        reach = max(abs(xs[0]), abs(ys[0])) + movement.steps
+        if not tiled and reach >= stride // 2:
+            new_stride = get_stride(reach)
+            for positions in tail_positions:
+                if positions is not None:
+                    repack_positions(positions, stride, new_stride)
+            stride = new_stride
+        for _ in range(movement.steps):
+            xs[0] += step_x
+            ys[0] += step_y
+            if head_positions is not None:
+                add_position(head_positions, xs[0], ys[0], stride)
+            for i in range(1, num_knots):
+                distance_x = xs[i - 1] - xs[i]
+                distance_y = ys[i - 1] - ys[i]
+                if -1 <= distance_x <= 1 and -1 <= distance_y <= 1:
+                    break  # a knot that stays put holds the rest of the rope in place
+                xs[i] += (distance_x > 0) - (distance_x < 0)
+                ys[i] += (distance_y > 0) - (distance_y < 0)
+                positions = tail_positions[i]
+                if positions is not None:
+                    if tiled:
+                        positions.add(xs[i], ys[i])
+                    else:
+                        positions.add(ys[i] * stride + xs[i])  # pack inlined
+    return [len(tail_positions[length - 1]) for length in lengths]
+
+
+def repack_positions(positions: Set[int], stride: int, new_stride: int):
+    keys = list(positions)
+    positions.clear()
+    positions.update(pack(*unpack(key, stride), new_stride) for key in keys)
+
+
+def add_position(positions: Set[int] | TiledBitmap, x: int, y: int, stride: int):
+    if isinstance(positions, TiledBitmap):
+        positions.add(x, y)
+    else:
+        positions.add(pack(x, y, stride))
+
+
+@timed("level9.parse_input")
+def parse_input() -> List[Movement]:
+    return list(map(Movement, iterate_input_file(9)))
+
 
-    return len(rope_2.tail_positions), len(rope_10.tail_positions)
+@timed("level9.level9")
+def level9(movements: List[Movement]) -> Tuple[int, int]:
+    num_places_visited_2, num_places_visited_10 = count_tail_positions(movements, (2, 10))
+    return num_places_visited_2, num_places_visited_10
 
 
 if __name__ == '__main__':
@@ -0,0 +1,346 @@
+import argparse
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+ROOT_DIRECTORY = Path(__file__).resolve().parent.parent
+
+# The solutions import each other and the utils both as packages and as top-level modules
+for _path in [ROOT_DIRECTORY / "solutions", ROOT_DIRECTORY / "util", ROOT_DIRECTORY]:
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from util import instrumentation  # noqa: E402
+from util.file_util import STDIN_SOURCE, set_input_source  # noqa: E402
+
+
+class Solver:
+    level: int
+    parts: List[int]
+    function: Callable[[], List[Any]]
+
+    def __init__(self, level: int, parts: List[int], function: Callable[[], List[Any]]):
+        self.level = level
+        self.parts = parts
+        self.function = function
+
+
+SOLVERS: List[Solver] = []
+
+
+def solver(level: int, *parts: int):
+    def register(function: Callable[[], List[Any]]) -> Callable[[], List[Any]]:
+        SOLVERS.append(Solver(level, list(parts), function))
+        return function
+
+    return register
+
+
+@solver(1, 1, 2)
+def solve_level1() -> List[Any]:
+    from solutions.level1 import level1_top
+    top_elves = level1_top(3)
+    return [top_elves[0][0], sum(total for total, _ in top_elves)]
+
+
+@solver(2, 1, 2)
+def solve_level2() -> List[Any]:
+    from solutions.level2 import level2
+    return list(level2())
+
+
+@solver(3, 1, 2)
+def solve_level3() -> List[Any]:
+    from solutions.level3 import level3
+    return list(level3())
+
+
+@solver(4, 1, 2)
+def solve_level4() -> List[Any]:
+    from solutions.level4 import level4
+    return list(level4())
+
+
+@solver(5, 1, 2)
+def solve_level5() -> List[Any]:
+    from solutions.level5 import level5
+    return list(level5())
+
+
+@solver(6, 1, 2)
+def solve_level6() -> List[Any]:
+    from solutions.level6 import level6
+    return list(level6())
+
+
+@solver(7, 1, 2)
+def solve_level7() -> List[Any]:
+    from solutions.level7 import level7
+    return list(level7())
+
+
+@solver(8, 1)
+def solve_level8_1() -> List[Any]:
+    from solutions.level8_1 import level8_1
+    return [level8_1()]
+
+
+@solver(8, 2)
+def solve_level8_2() -> List[Any]:
+    from solutions.level8_2 import level8_2
+    return [level8_2()]
+
+
+@solver(9, 1, 2)
+def solve_level9() -> List[Any]:
+    from solutions.level9 import level9, parse_input
+    return list(level9(parse_input()))
+
+
+@solver(10, 1)
+def solve_level10_1() -> List[Any]:
+    from solutions.level10 import level10_1
+    return [level10_1()]
+
+
+@solver(10, 2)
+def solve_level10_2() -> List[Any]:
+    from solutions.level10 import level10_2
+    result = level10_2()
+    return ["\n".join(result[i:i + 40] for i in range(0, len(result), 40))]
+
+
+@solver(11, 1)
+def solve_level11_1() -> List[Any]:
+    from solutions.level11 import level11
+    return [level11(3, 20)]
+
+
+@solver(11, 2)
+def solve_level11_2() -> List[Any]:
+    from solutions.level11 import level11
+    return [level11(1, 10000)]
+
+
+@solver(12, 1, 2)
+def solve_level12() -> List[Any]:
+    from solutions.level12 import level12
+    return list(level12())
+
+
+@solver(13, 1)
+def solve_level13_1() -> List[Any]:
+    from solutions.level13 import level13_1
+    return [level13_1()]
+
+
+@solver(13, 2)
+def solve_level13_2() -> List[Any]:
+    from solutions.level13 import level13_2
+    return [level13_2()]
+
+
+@solver(14, 1, 2)
+def solve_level14() -> List[Any]:
+    from solutions.level14 import level14
+    return list(level14())
+
+
+@solver(15, 1, 2)
+def solve_level15() -> List[Any]:
+    from solutions.level15 import level15
+    return list(level15(2000000, 4000000))
+
+
+@solver(16, 1)
+def solve_level16_1() -> List[Any]:
+    from solutions.level16_1 import level16_1
+    return [level16_1(10000, ["TA", "QK", "JA", "VK"])]
+
+
+@solver(16, 2)
+def solve_level16_2() -> List[Any]:
+    from solutions.level16_2 import level16_2
+    return [level16_2(100000, ["QK", "JA", "VK", "ID"], ["TA", "DC", "XN", "DH"])]
+
+
+@solver(17, 1)
+def solve_level17_1() -> List[Any]:
+    from solutions.level17 import level17
+    return [level17(2022)]
+
+
+@solver(17, 2)
+def solve_level17_2() -> List[Any]:
+    from solutions.level17 import level17
+    return [level17(1000000000000, 1725, 3420 - 1725)]
+
+
+@solver(18, 1, 2)
+def solve_level18() -> List[Any]:
+    from solutions.level18 import level18
+    from util.file_util import read_input_file
+    return list(level18(read_input_file(18)))
+
+
+@solver(19, 1, 2)
+def solve_level19() -> List[Any]:
+    from solutions.level19 import level19
+    return list(level19())
+
+
+@solver(20, 1)
+def solve_level20_1() -> List[Any]:
+    from solutions.level20 import level20
+    return [level20(1, 1)]
+
+
+@solver(20, 2)
+def solve_level20_2() -> List[Any]:
+    from solutions.level20 import level20
+    return [level20(10, 811589153)]
+
+
+@solver(21, 1)
+def solve_level21_1() -> List[Any]:
+    from solutions.level21_1 import level21_1
+    return [level21_1()]
+
+
+@solver(21, 2)
+def solve_level21_2() -> List[Any]:
+    from solutions.level21_2 import level21_2
+    return [level21_2()]
+
+
+@solver(22, 1)
+def solve_level22_1() -> List[Any]:
+    from solutions.level22 import level22, WrapType
+    return [level22(WrapType.Map)]
+
+
+@solver(22, 2)
+def solve_level22_2() -> List[Any]:
+    from solutions.level22 import level22, WrapType
+    return [level22(WrapType.Cube, 1)]
+
+
+@solver(23, 1, 2)
+def solve_level23() -> List[Any]:
+    from solutions.level23 import level23
+    return list(level23())
+
+
+@solver(24, 1, 2)
+def solve_level24() -> List[Any]:
+    from solutions.level24 import level24
+    return list(level24())
+
+
+@solver(25, 1)
+def solve_level25() -> List[Any]:
+    from solutions.level25 import level25
+    return [level25()[0]]
+
+
+def select_solvers(levels: List[int], parts: List[int]) -> List[Solver]:
+    return [
+        _solver for _solver in SOLVERS
+        if (not levels or _solver.level in levels) and (not parts or set(_solver.parts) & set(parts))
+    ]
+
+
+def run_solver(solver_id: int, input_sources: Dict[int, str]) -> Dict[str, Any]:
+    for level_id, source in input_sources.items():
+        set_input_source(level_id, source)
+
+    _solver = SOLVERS[solver_id]
+    result: Dict[str, Any] = {"level": _solver.level, "parts": _solver.parts}
+    instrumentation.reset()
+    start_time = time.perf_counter()
+    try:
+        with instrumentation.profile(f"level{_solver.level}"):
+            result["answers"] = _solver.function()
+    except Exception as exception:
+        result["error"] = "".join(traceback.format_exception_only(exception)).strip()
+    result["wall_time"] = time.perf_counter() - start_time
+    result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if instrumentation.ENABLED:
+        result["timings"] = dict(instrumentation.timings)
+        result["counters"] = dict(instrumentation.counters)
+    return result
+
+
+def run_solvers(solvers: List[Solver], input_sources: Dict[int, str], jobs: int) -> List[Dict[str, Any]]:
+    # A fresh process per solver keeps the peak RSS of one solver from leaking into the next
+    solver_ids = [SOLVERS.index(_solver) for _solver in solvers]
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as executor:
+        futures = [executor.submit(run_solver, solver_id, input_sources) for solver_id in solver_ids]
+        return [future.result() for future in futures]
+
+
+@contextmanager
+def spool_stdin(input_sources: Dict[int, str]) -> Iterator[Dict[int, str]]:
+    # stdin can only be read once, by this process. It is copied to a temporary file that every solver of every
+    # level reading it then opens on its own, in the worker processes like any other input file.
+    if STDIN_SOURCE not in input_sources.values():
+        yield input_sources
+        return
+
+    with tempfile.TemporaryDirectory(prefix="aoc-stdin-") as directory:
+        path = Path(directory) / "stdin.txt"
+        with open(path, "wb") as spool_file:
+            shutil.copyfileobj(sys.stdin.buffer, spool_file, 1 << 20)
+        yield {
+            level_id: str(path) if source == STDIN_SOURCE else source for level_id, source in input_sources.items()
+        }
+
+
+def parse_input_sources(definitions: List[str]) -> Dict[int, str]:
+    input_sources: Dict[int, str] = {}
+    for definition in definitions:
+        level_id, _, source = definition.partition("=")
+        if not level_id.isdecimal() or source == "":
+            raise ValueError(f"Input source must look like LEVEL=PATH, got {definition}")
+        input_sources[int(level_id)] = source if source == STDIN_SOURCE else str(Path(source).resolve())
+    return input_sources
+
+
+def parse_arguments(arguments: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m solutions", description="Run Advent of Code 2022 levels")
+    parser.add_argument("levels", type=int, nargs="*", help="levels to run, all if omitted")
+    parser.add_argument("-p", "--parts", type=int, nargs="+", default=[], choices=[1, 2], help="parts to run")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument(
+        "-i", "--input", action="append", default=[], metavar="LEVEL=PATH", help="input file or - for stdin"
+    )
+    parser.add_argument("--instrument", action="store_true", help="report timers, counters and progress")
+    parser.add_argument("--profile", choices=["cpu", "memory"], help="profile every solver to stderr")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: List[str] | None = None) -> int:
+    args = parse_arguments(arguments)
+    input_sources = parse_input_sources(args.input)
+    solvers = select_solvers(args.levels, args.parts)
+    # the workers read these when they import the instrumentation
+    if args.instrument:
+        os.environ["AOC_INSTRUMENT"] = "1"
+        instrumentation.enable()
+    if args.profile:
+        os.environ["AOC_PROFILE"] = args.profile
+        instrumentation.PROFILE_MODE = args.profile
+    with spool_stdin(input_sources) as spooled_input_sources:
+        results = run_solvers(solvers, spooled_input_sources, args.jobs)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 1 if any("error" in result for result in results) else 0
@@ -0,0 +1,15 @@
+import pytest
+
+import util.cache as cache
+from util.file_util import set_file_id
+
+# the tests run on the example inputs, file id 0
+set_file_id(0)
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path_factory, monkeypatch):
+    # every test gets its own cache, so test runs and real runs never read each other's entries
+    directory = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(cache, "CACHE_DIRECTORY", directory)
+    return directory
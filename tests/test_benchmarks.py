@@ -0,0 +1,62 @@
+from random import Random
+
+from benchmarks.bench import find_regressions
+from benchmarks.complexity import fit_complexity
+from benchmarks.generators import BASE_SIZES, GENERATORS, write_input
+from solutions.level6 import find_signal_start
+from solutions.level15 import Field
+from util.file_util import read_input_file, set_input_source, clear_input_sources
+
+
+def test_fit_complexity():
+    sizes = [1000, 10000, 100000]
+    assert fit_complexity(sizes, [0.001, 0.01, 0.1])["model"] == "O(n)"
+    assert fit_complexity(sizes, [0.001, 0.1, 10])["model"] == "O(n^2)"
+    assert round(fit_complexity(sizes, [0.001, 0.1, 10])["exponent"]) == 2
+
+
+def test_find_regressions():
+    baseline = {"1/1+2": {"real": {"time": 1.0}, "scales": {"10": {"time": 2.0}}}}
+    results = {"1/1+2": {"real": {"time": 1.1}, "scales": {"10": {"time": 3.0}}}}
+    assert find_regressions(results, baseline, 0.25, 0.01) == ["Level 1/1+2 (x10): 2.0000s -> 3.0000s"]
+
+
+def test_generators(tmp_path):
+    assert sorted(GENERATORS) == list(range(1, 26))
+    for compressed in [False, True]:
+        path = tmp_path / ("level9.txt.gz" if compressed else "level9.txt")
+        write_input(9, 50, path, seed=3)
+        set_input_source(9, path)
+        try:
+            lines = read_input_file(9)
+        finally:
+            clear_input_sources()
+        assert len(lines) == 50
+        assert all(line[0] in "UDLR" and int(line[2:]) > 0 for line in lines)
+
+
+def test_generator_sizes():
+    # the output grows linearly beyond a fixed part, doubling the size doubles the growth
+    for level, generator in GENERATORS.items():
+        size = 2 * BASE_SIZES[level]
+        lengths = [sum(len(line) + 1 for line in generator(factor * size, Random(level))) for factor in [1, 2, 4]]
+        growth_1, growth_2 = lengths[1] - lengths[0], lengths[2] - lengths[1]
+        assert growth_1 > 0, f"Level {level} does not grow"
+        assert 1.5 < growth_2 / growth_1 < 2.7, f"Level {level} grows like {lengths}"
+
+
+def test_generate_level6():
+    lines = list(GENERATORS[6](100, Random(1)))
+    assert find_signal_start(lines[0], 4) == 90
+    assert find_signal_start(lines[0], 14) == 100
+
+
+def test_generate_level15():
+    # the generator draws the hidden point first
+    random = Random(15)
+    hidden_x, hidden_y = random.randint(0, 4000000), random.randint(0, 4000000)
+    field = Field(list(GENERATORS[15](40, Random(15))))
+    assert field.get_uncovered_x(hidden_y, 4000000) == hidden_x
+    for y in Random(0).sample(range(4000001), 200) + [0, hidden_y - 1, hidden_y + 1, 4000000]:
+        if y != hidden_y:
+            assert field.get_uncovered_x(y, 4000000) is None
@@ -0,0 +1,25 @@
+from random import Random
+
+from util.bitmap import TILE_SIZE, TiledBitmap
+
+
+def test_tiled_bitmap():
+    random = Random(25)
+    positions = {(random.randint(-200, 200), random.randint(-200, 200)) for _ in range(2000)}
+    bitmap = TiledBitmap()
+    for x, y in positions:
+        bitmap.add(x, y)
+        bitmap.add(x, y)
+    assert len(bitmap) == len(positions)
+    assert set(bitmap) == positions
+    assert all(position in bitmap for position in positions)
+    assert (201, 0) not in bitmap and (10 ** 6, -(10 ** 6)) not in bitmap
+
+
+def test_tiled_bitmap_tiles():
+    bitmap = TiledBitmap()
+    for x in range(-TILE_SIZE, TILE_SIZE):
+        bitmap.add(x, 0)
+        bitmap.add(x, -1)
+    assert len(bitmap.tiles) == 4
+    assert len(bitmap) == 4 * TILE_SIZE
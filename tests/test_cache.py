@@ -0,0 +1,39 @@
+import util.cache as cache
+
+
+def test_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIRECTORY", tmp_path)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"value": len(builds)}
+
+    assert cache.cached("test", lambda: "digest", 1, build) == {"value": 1}
+    assert cache.cached("test", lambda: "digest", 1, build) == {"value": 1}
+    assert cache.cached("test", lambda: "digest", 2, build) == {"value": 2}
+    assert cache.cached("test", lambda: None, 2, build) == {"value": 3}
+    assert len(list(tmp_path.iterdir())) == 2
+
+    cache.evict(0)
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_cached_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIRECTORY", tmp_path)
+    monkeypatch.setattr(cache, "CACHE_ENABLED", False)
+    builds = []
+
+    def get_digest(*_):
+        raise AssertionError("The digest is not needed without a cache")
+
+    monkeypatch.setattr(cache, "get_source_digest", get_digest)
+
+    def build():
+        builds.append(1)
+        return len(builds)
+
+    assert cache.cached("test", get_digest, 1, build) == 1
+    assert cache.cached("test", get_digest, 1, build) == 2
+    assert cache.cached_parse(18, "test", 1, build) == 3
+    assert list(tmp_path.iterdir()) == []
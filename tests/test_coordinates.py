@@ -0,0 +1,50 @@
+import pytest
+
+from util.coordinates import (
+    NEIGHBOURS_8,
+    STRIDE,
+    get_offsets,
+    get_stride,
+    pack,
+    pack3,
+    pack_unbounded,
+    unpack,
+    unpack3,
+    unpack_unbounded,
+)
+
+
+def test_pack():
+    for x, y in [(0, 0), (-1, -1), (5, -7), (-STRIDE // 2, 3), (STRIDE // 2 - 1, -(10 ** 12))]:
+        assert unpack(pack(x, y)) == (x, y)
+    assert unpack(pack(3, -4, 7), 7) == (3, -4)
+    assert unpack3(pack3(-2, 5, -9)) == (-2, 5, -9)
+
+
+def test_pack_out_of_range():
+    # beyond the stride x would run into the next row
+    for x in [STRIDE // 2, -STRIDE // 2 - 1, 600000]:
+        with pytest.raises(ValueError):
+            pack(x, 0)
+    with pytest.raises(ValueError):
+        pack(4, 0, 7)
+    with pytest.raises(ValueError):
+        pack3(0, STRIDE, 0)
+    stride = get_stride(600000)
+    assert unpack(pack(600000, 1, stride), stride) == (600000, 1)
+    assert unpack(pack(-600000, 1, stride), stride) == (-600000, 1)
+
+
+def test_pack_unbounded():
+    positions = [(x, y) for x in range(-20, 21) for y in range(-20, 21)]
+    positions += [(STRIDE, 0), (21, -STRIDE), (-(10 ** 30), 10 ** 40), (10 ** 12, -1)]
+    keys = [pack_unbounded(x, y) for x, y in positions]
+    assert len(set(keys)) == len(positions)
+    assert [unpack_unbounded(key) for key in keys] == positions
+
+
+def test_offsets():
+    key = pack(-1, 2)
+    assert [unpack(key + offset) for offset in get_offsets(NEIGHBOURS_8)] == [
+        (-1 + x, 2 + y) for x, y in NEIGHBOURS_8
+    ]
@@ -0,0 +1,50 @@
+import gzip
+import lzma
+import mmap
+
+from util.file_util import (
+    clear_input_sources,
+    iterate_input_file,
+    iterate_input_file_chunks,
+    map_input_file,
+    map_or_stream_input_file,
+    read_input_file,
+    set_input_source,
+)
+
+
+def test_iterate_input_file():
+    assert list(iterate_input_file(1)) == read_input_file(1)
+    assert list(iterate_input_file(5, False)) == read_input_file(5, False)
+
+
+def test_map_input_file():
+    with map_input_file(6) as buffer:
+        assert bytes(buffer).decode().strip() == read_input_file(6)[0]
+
+
+def test_compressed_input_source(tmp_path):
+    lines = read_input_file(1)
+    for suffix, open_function in [(".gz", gzip.open), (".xz", lzma.open)]:
+        path = tmp_path / f"level1{suffix}"
+        with open_function(path, "wt") as output_file:
+            output_file.write("\n".join(lines))
+        set_input_source(1, path)
+        try:
+            assert read_input_file(1) == lines
+            with map_input_file(1) as buffer:
+                # spooled to a temporary file and mapped, not read into memory
+                assert isinstance(buffer, mmap.mmap)
+                assert bytes(buffer).decode().split("\n") == lines
+            with map_or_stream_input_file(1, 7) as pieces:
+                assert b"".join(pieces).decode().split("\n") == lines
+        finally:
+            clear_input_sources()
+
+
+def test_iterate_input_file_chunks():
+    with map_input_file(6) as buffer:
+        content = bytes(buffer)
+    chunks = list(iterate_input_file_chunks(6, 5))
+    assert b"".join(chunks) == content
+    assert max(map(len, chunks)) == 5
@@ -0,0 +1,34 @@
+import pytest
+
+from util.grid import DIGITS, Grid
+
+
+def test_from_lines():
+    grid = Grid.from_lines(["123", "45"], DIGITS)
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid[2, 0] == 3
+    assert grid[2, 1] == 0
+    assert grid.get(3, 0, 9) == 9
+    assert grid.find(5) == (1, 1)
+    assert grid.to_lines({value: str(value) for value in range(10)}) == ["123", "450"]
+    with pytest.raises(IndexError):
+        _ = grid[-1, 0]
+
+
+def test_neighbours():
+    grid = Grid(3, 3)
+    assert sorted(grid.neighbours(0, 0)) == [(0, 1), (1, 0)]
+    assert len(list(grid.neighbours(1, 1, diagonal=True))) == 8
+    assert sorted(grid.neighbour_indices(grid.index(2, 1))) == [2, 4, 8]
+
+
+def test_pad_and_numpy():
+    grid = Grid(2, 1, 7, "i")
+    padded = grid.pad(1)
+    assert (padded.width, padded.height) == (4, 3)
+    assert padded.count(7) == 2
+    assert padded[1, 1] == 7
+
+    view = padded.to_numpy()
+    view[0, 0] = 3
+    assert padded[0, 0] == 3
@@ -0,0 +1,35 @@
+from util import instrumentation
+from util.instrumentation import count, timed, timer
+
+
+@timed("test.double")
+def double(value: int) -> int:
+    return value * 2
+
+
+def test_disabled_instrumentation():
+    instrumentation.reset()
+    instrumentation.disable()
+    assert double(2) == 4
+    count("test.counter")
+    with timer("test.timer"):
+        pass
+    assert not instrumentation.timings
+    assert not instrumentation.counters
+
+
+def test_enabled_instrumentation():
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        assert double(2) == 4
+        count("test.counter", 3)
+        with timer("test.timer"):
+            pass
+        with instrumentation.profile("test", "memory"):
+            double(3)
+    finally:
+        instrumentation.disable()
+    assert set(instrumentation.timings) == {"test.double", "test.timer"}
+    assert instrumentation.counters["test.counter"] == 3
+    assert instrumentation.counters["test.peak_traced_bytes"] >= 0
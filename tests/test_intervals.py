@@ -0,0 +1,27 @@
+from random import Random
+
+import pytest
+
+from util.intervals import IntervalTree
+
+
+def test_interval_tree():
+    random = Random(4)
+    intervals = []
+    for interval_id in range(300):
+        start = random.randint(0, 100)
+        intervals.append((start, start + random.randint(0, 20), interval_id))
+    tree = IntervalTree(intervals)
+
+    for point in range(-1, 125):
+        assert sorted(tree.stab(point)) == [i for start, end, i in intervals if start <= point <= end]
+    for start in range(0, 120, 7):
+        end = start + random.randint(0, 10)
+        expected = [i for left, right, i in intervals if left <= end and right >= start]
+        assert sorted(tree.overlap(start, end)) == expected
+
+
+def test_invalid_interval():
+    assert IntervalTree([]).stab(1) == []
+    with pytest.raises(ValueError):
+        IntervalTree([(3, 2, 0)])
@@ -1,7 +1,37 @@
-from solutions.level1 import level1
+import gzip
+
+from solutions.level1 import calc_group_totals, find_top_elves, iterate_elf_totals, level1, level1_batch, level1_top
+from util.file_util import clear_input_sources, read_input_file, set_input_source
 
 
 def test_level1():
     _max_elf, _max_three_elves_weight = level1()
     assert _max_elf.total_weight() == 24000
     assert _max_three_elves_weight == 45000
+
+
+def test_level1_top():
+    assert level1_top(3) == [(24000, 3), (11000, 2), (10000, 4)]
+    assert find_top_elves([5, 7, 5, 1], 2) == [(7, 1), (5, 0)]
+
+
+def test_level1_batch():
+    assert level1_batch(3) == level1_top(3)
+    lines = ["1", "2", "", "", "30", "4"] * 1000
+    buffer = ("\n".join(lines) + "\n").encode()
+    for chunk_size in [1, 7, 1 << 20]:
+        assert list(calc_group_totals(buffer, chunk_size)) == list(iterate_elf_totals(lines))
+        pieces = (buffer[start:start + chunk_size] for start in range(0, len(buffer), chunk_size))
+        assert list(calc_group_totals(pieces)) == list(iterate_elf_totals(lines))
+
+
+def test_level1_batch_compressed(tmp_path):
+    expected = level1_top(3)
+    path = tmp_path / "level1.txt.gz"
+    with gzip.open(path, "wt") as output_file:
+        output_file.write("\n".join(read_input_file(1)))
+    set_input_source(1, path)
+    try:
+        assert level1_batch(3) == expected
+    finally:
+        clear_input_sources()
@@ -1,7 +1,24 @@
-from solutions.level2 import level2
+import pytest
+
+from solutions.level2 import count_round_codes, count_round_codes_batch, level2, level2_batch
 
 
 def test_level2():
     score_round_1, score_round_2 = level2()
     assert score_round_1 == 15
     assert score_round_2 == 12
+
+
+def test_level2_batch():
+    assert level2_batch() == level2()
+    assert count_round_codes_batch(b"A Y\r\nB X\n\nC Z\nA Y") == count_round_codes(["A Y", "B X", "", "C Z", "A Y"])
+
+
+def test_count_round_codes_malformed():
+    # the broken line sits in the middle of a chunk, both paths reject it
+    for broken in ["B", "BX", "B  X", "B XY", "B X Z", "D X", "B W"]:
+        lines = ["A Y", broken, "C Z"]
+        with pytest.raises(ValueError):
+            count_round_codes(lines)
+        with pytest.raises(ValueError):
+            count_round_codes_batch("\n".join(lines).encode())
@@ -1,7 +1,18 @@
-from level23 import level23
+from level23 import Direction, Elf, get_board_stride, level23, move_elves
 
 
 def test_level23():
     _covered_area, _final_round = level23()
     assert _covered_area == 110
     assert _final_round == 20
+
+
+def test_move_elves_wide_board():
+    # far beyond the default stride of util.coordinates
+    width = 1 << 21
+    stride = get_board_stride(width)
+    elves = {elf.get_position_id(stride): elf for elf in [Elf(width - 2, 0), Elf(width - 1, 0), Elf(0, 1)]}
+    elves, finished = move_elves(elves, list(Direction), stride)
+    assert not finished
+    assert sorted((elf.x, elf.y) for elf in elves.values()) == [(0, 1), (width - 2, -1), (width - 1, -1)]
+    assert sorted(elves) == sorted(elf.get_position_id(stride) for elf in elves.values())
@@ -1,7 +1,19 @@
-from level24 import level24
+import pytest
+
+from level24 import Field, level24, level24_trip
 
 
 def test_level24():
     _minutes_to_exit, _minutes_to_round_trip = level24()
     assert _minutes_to_exit == 18
     assert _minutes_to_round_trip == 54
+
+
+def test_level24_trip():
+    # the blizzards fill the whole valley at every minute
+    field = Field(["#.###", "#>>>#", "###.#"])
+    with pytest.raises(ValueError):
+        level24_trip(field, (1, 0, 0), field.end)
+    with pytest.raises(ValueError):
+        level24_trip(field, (2, 1, 0), field.end)
+    assert level24_trip(Field(["#.###", "#...#", "###.#"]), (1, 0, 0), (3, 2)) == 4
@@ -1,7 +1,15 @@
-from solutions.level3 import level3
+from solutions.level3 import Rucksack, find_badge, get_item_priority, level3
 
 
 def test_level3():
     wrong_item_priority, badges_priority = level3()
     assert wrong_item_priority == 157
     assert badges_priority == 70
+
+
+def test_rucksack_masks():
+    rucksack = Rucksack("vJrwpWtwJgWrhcsFMMfFFhFp")
+    assert rucksack.find_wrong_item() == "p"
+    assert get_item_priority(rucksack.find_wrong_item()) == rucksack.get_wrong_item_mask().bit_length()
+    group = list(map(Rucksack, ["vJrwpWtwJgWrhcsFMMfFFhFp", "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL", "PmmdzqPrVvPwwTWBwg"]))
+    assert find_badge(group) == "r"
@@ -1,7 +1,25 @@
-from solutions.level4 import level4
+from solutions.level4 import AssignmentIndex, count_overlaps, iterate_columns, level4, level4_columnar, parse_input_file
+from util.file_util import map_input_file
 
 
 def test_level3():
     _num_full_overlaps, _num_partly_overlaps = level4()
     assert _num_full_overlaps == 2
     assert _num_partly_overlaps == 4
+
+
+def test_level4_columnar():
+    assert level4_columnar() == level4()
+    with map_input_file(4) as buffer:
+        content = bytes(buffer)
+    pieces = [content[start:start + 5] for start in range(0, len(content), 5)]
+    counts = [count_overlaps(columns) for columns in iterate_columns(pieces)]
+    assert len(counts) > 1
+    assert tuple(map(sum, zip(*counts))) == level4()
+
+
+def test_assignment_index():
+    index = AssignmentIndex(parse_input_file())
+    assert index.get_covering_pairs(1) == []
+    assert index.get_covering_pairs(4) == [0, 1, 3, 4, 5]
+    assert index.get_overlapping_pairs(8, 9) == [0, 2, 3, 5]
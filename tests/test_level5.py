@@ -1,7 +1,44 @@
-from solutions.level5 import level5
+from random import Random
+
+import pytest
+
+import solutions.level5 as level5_module
+from solutions.level5 import Cargo, Command, CrateStack, level5
 
 
 def test_level5():
     _top_items1, _top_items2 = level5()
     assert _top_items1 == "CMZ"
     assert _top_items2 == "MCD"
+
+
+def test_cargo_move():
+    cargo = Cargo([["A", "B", "C"], []])
+    cargo.move(Command("move 2 from 1 to 2"), True)
+    assert cargo.stacks == [["A"], ["C", "B"]]
+    cargo.move(Command("move 1 from 2 to 1"), False)
+    assert cargo.get_top_items() == "BC"
+    with pytest.raises(ValueError):
+        cargo.move(Command("move 4 from 1 to 2"), False)
+
+
+def test_crate_stack(monkeypatch):
+    monkeypatch.setattr(level5_module, "CHUNK_SIZE", 3)
+    random = Random(5)
+    stacks = [[str(random.randint(0, 9)) for _ in range(random.randint(0, 30))] for _ in range(4)]
+    commands = []
+    for _ in range(200):
+        move_from, move_to = random.sample(range(4), 2)
+        commands.append(Command(f"move {random.randint(0, 5)} from {move_from + 1} to {move_to + 1}"))
+
+    for reverse in [True, False]:
+        cargo, deep_cargo = Cargo([stack.copy() for stack in stacks]), Cargo(stacks, True)
+        for command in commands:
+            if command.amount <= len(cargo.stacks[command.move_from]):
+                cargo.move(command, reverse)
+                deep_cargo.move(command, reverse)
+        assert [list(stack) for stack in deep_cargo.stacks] == cargo.stacks
+        assert [len(stack) for stack in deep_cargo.stacks] == [len(stack) for stack in cargo.stacks]
+
+    assert level5(True) == level5()
+    assert CrateStack("abc")[-1] == "c"
@@ -1,4 +1,6 @@
-from solutions.level6 import level6, find_signal_start
+import pytest
+
+from solutions.level6 import level6, find_signal_start, find_signal_starts
 
 
 def test_level6():
@@ -15,3 +17,10 @@ def test_level6():
     assert find_signal_start("nppdvjthqldpwncqszvftbrmjlhg", 14) == 23
     assert find_signal_start("nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg", 14) == 29
     assert find_signal_start("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw", 14) == 26
+
+
+def test_find_signal_starts():
+    chunks = [b"nznrnfrf", b"ntjfmvfwmzdf", b"", b"jlvtqnbhcprsg"]
+    assert find_signal_starts(chunks, [14, 4]) == {4: 10, 14: 29}
+    with pytest.raises(ValueError):
+        find_signal_starts([b"abcabc"], [4])
@@ -1,7 +1,27 @@
-from solutions.level7 import level7
+from solutions.level7 import Directory, get_all_directories, iterate_directory_sizes, level7, level7_streaming
 
 
 def test_level7():
     _level_1_size, _level_2_size = level7()
     assert _level_1_size == 95437
     assert _level_2_size == 24933642
+
+
+def test_directory_sizes():
+    root = Directory(None, "/")
+    deep = root
+    for i in range(5000):
+        deep = deep.get_subdirectory(f"d{i}")
+    deep.create_file("a", 10)
+    root.get_subdirectory("d0").create_file("b", 5)
+    assert root.get_size() == 15
+    assert len(get_all_directories(root)) == 5001
+
+    deep.parent.remove_item(deep.name)
+    assert deep.parent.size is None
+    assert root.get_size() == 5
+
+
+def test_level7_streaming():
+    assert level7_streaming() == level7()
+    assert sorted(iterate_directory_sizes(["$ cd /", "$ ls", "dir a", "5 f", "$ cd a", "$ ls", "7 g"])) == [7, 12]
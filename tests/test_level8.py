@@ -1,12 +1,28 @@
-from solutions.level8_1 import level8_1
-from solutions.level8_2 import level8_2
+from random import Random
+
+from solutions.level8_1 import level8_1, level8_1_batch
+from solutions.level8_2 import calc_scenic_score, iterate_scenic_scores, level8_2, level8_2_top
+from util.grid import Grid
 
 
 def test_level8_1():
     _num_visible_trees = level8_1()
     assert _num_visible_trees == 21
+    assert level8_1_batch() == 21
 
 
 def test_level8_2():
     _num_visible_trees = level8_2()
     assert _num_visible_trees == 8
+
+
+def test_level8_2_top():
+    assert level8_2_top(2) == [(8, 2, 3), (6, 1, 2)]
+
+
+def test_iterate_scenic_scores():
+    random = Random(8)
+    for width, height in [(1, 1), (1, 5), (6, 1), (7, 9)]:
+        trees = Grid(width, height, cells=bytearray(random.randrange(10) for _ in range(width * height)))
+        scores = sorted((x, y, score) for score, x, y in iterate_scenic_scores(trees))
+        assert scores == [(x, y, calc_scenic_score(trees, y, x)) for x in range(width) for y in range(height)]
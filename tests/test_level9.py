@@ -1,6 +1,7 @@
-from typing import List
+from random import Random
+from typing import List, Sequence
 
-from solutions.level9 import level9, Movement, parse_input
+from solutions.level9 import count_tail_positions, level9, Movement, parse_input, Rope
 from util.file_util import read_input_file_id
 
 
@@ -21,3 +22,63 @@ def test_level9_2():
     _num_places_visited_2, _num_places_visited_10 = level9(_movements)
     assert _num_places_visited_2 == 88
     assert _num_places_visited_10 == 36
+
+
+def count_tail_positions_tuples(movements: List[Movement], lengths: Sequence[int]) -> List[int]:
+    # straightforward reference with tuple keys, which cannot collide however far the rope drifts
+    knots = [(0, 0)] * max(lengths)
+    visited = [{(0, 0)} for _ in knots]
+    for movement in movements:
+        for _ in range(movement.steps):
+            x, y = knots[0]
+            step_x, step_y = {"U": (0, 1), "D": (0, -1), "R": (1, 0), "L": (-1, 0)}[movement.direction]
+            knots[0] = (x + step_x, y + step_y)
+            for i in range(1, len(knots)):
+                distance_x = knots[i - 1][0] - knots[i][0]
+                distance_y = knots[i - 1][1] - knots[i][1]
+                if abs(distance_x) > 1 or abs(distance_y) > 1:
+                    knots[i] = (knots[i][0] + (distance_x > 0) - (distance_x < 0),
+                                knots[i][1] + (distance_y > 0) - (distance_y < 0))
+            for i, knot in enumerate(knots):
+                visited[i].add(knot)
+    return [len(visited[length - 1]) for length in lengths]
+
+
+def test_count_tail_positions():
+    random = Random(9)
+    movements = [Movement(f"{random.choice('UDLR')} {random.randint(1, 12)}") for _ in range(300)]
+    lengths = [1, 2, 3, 10, 25, 10]
+    expected = []
+    for length in lengths:
+        rope = Rope(length)
+        for movement in movements:
+            movement.execute(rope)
+        expected.append(len(rope.tail_positions))
+    assert count_tail_positions(movements, lengths) == expected
+    assert count_tail_positions(movements, lengths, True) == expected
+
+
+def test_count_tail_positions_long_drift():
+    # far beyond 2 ** 19 in both directions, where a fixed 2 ** 20 stride made rows collide
+    movements = list(map(Movement, ["R 600000", "U 1", "L 1100000"]))
+    lengths = [1, 2]
+    expected = count_tail_positions_tuples(movements, lengths)
+    assert expected == [1700002, 1699998]
+    assert count_tail_positions(movements, lengths) == expected
+    assert count_tail_positions(movements, lengths, True) == expected
+
+
+def test_count_tail_positions_stream():
+    # the movements are read once and lazily, in both modes
+    for tiled in [False, True]:
+        lines = read_input_file_id(9, 2)
+        num_read = 0
+
+        def iterate_movements():
+            nonlocal num_read
+            for line in lines:
+                num_read += 1
+                yield Movement(line)
+
+        assert count_tail_positions(iterate_movements(), (2, 10), tiled) == [88, 36]
+        assert num_read == len(lines)
@@ -0,0 +1,27 @@
+import io
+import json
+import sys
+
+from solutions.runner import ROOT_DIRECTORY, SOLVERS, main, run_solver, select_solvers
+
+
+def test_select_solvers():
+    assert len(select_solvers([], [])) == len(SOLVERS)
+    assert [s.parts for s in select_solvers([8], [])] == [[1], [2]]
+    assert [s.parts for s in select_solvers([8, 25], [2])] == [[2]]
+
+
+def test_run_solver():
+    result = run_solver(SOLVERS.index(select_solvers([6], [])[0]), {})
+    assert result["answers"] == [7, 19]
+    assert result["wall_time"] > 0
+    assert result["peak_rss_kb"] > 0
+
+
+def test_main_stdin(monkeypatch, capsys):
+    # both parts of level 20 read the same stdin, and each part parses its input twice
+    with open(ROOT_DIRECTORY / "input-files" / "level20-0.txt", "rb") as input_file:
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(input_file.read())))
+    assert main(["20", "-i", "20=-", "-j", "2"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert [result["answers"] for result in results] == [[3], [1623178306]]
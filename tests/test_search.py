@@ -0,0 +1,52 @@
+import pytest
+
+from util.search import UNREACHED, all_pairs, bfs, dijkstra, layered_grid_search
+
+# 0 - 1 - 2 - 3, 4 is isolated
+LINE = [[1], [0, 2], [1, 3], [2], []]
+
+
+def test_bfs():
+    search = bfs([0], LINE.__getitem__, 5)
+    assert list(search.distances) == [0, 1, 2, 3, UNREACHED]
+    assert search.path(3) == [1, 2, 3]
+    assert search.path(0) == []
+    assert search.path(4) == []
+
+    search = bfs([0, 3], LINE.__getitem__, 5, lambda node: node == 2)
+    assert search.target == 2
+    assert search.distance(2) == 1
+
+    search = bfs([0], LINE.__getitem__, 5, track_paths=False)
+    assert list(search.distances) == [0, 1, 2, 3, UNREACHED]
+    assert search.predecessors is None
+    with pytest.raises(ValueError):
+        search.path(3)
+
+
+def test_dijkstra():
+    edges = {0: [(1, 5), (2, 1)], 1: [(3, 1)], 2: [(1, 1), (3, 7)], 3: []}
+    search = dijkstra([0], edges.__getitem__, 4)
+    assert list(search.distances) == [0, 2, 1, 3]
+    assert search.path(3) == [2, 1, 3]
+
+    search = dijkstra([0], edges.__getitem__, 4, lambda node: node == 3, lambda node: 0 if node == 3 else 1)
+    assert search.target == 3
+    assert search.distance(3) == 3
+
+
+def test_layered_grid_search():
+    # enter at layer 1, then two steps right and one down
+    assert layered_grid_search(3, 2, [(0, 0)], (2, 1), lambda y, layer: 0, 1) == 4
+    assert layered_grid_search(3, 2, [(0, 0)], (2, 1), lambda y, layer: 0, 1, 10) == 14
+    # the middle of a single row is blocked on odd layers, the walker waits for it
+    assert layered_grid_search(3, 1, [(0, 0)], (2, 0), lambda y, layer: 0b010 * (layer % 2), 2) == 3
+    # the middle is always blocked
+    with pytest.raises(ValueError):
+        layered_grid_search(3, 1, [(0, 0)], (2, 0), lambda y, layer: 0b010, 1)
+
+
+def test_all_pairs():
+    searches = all_pairs(5, LINE.__getitem__)
+    assert searches[3].path(0) == [2, 1, 0]
+    assert searches[4].distance(0) == UNREACHED
@@ -0,0 +1,45 @@
+from typing import Dict, Iterator, Tuple
+
+from util.coordinates import pack_unbounded, unpack_unbounded
+
+# One bit per cell in square tiles that are only created once a cell in them is set, so the memory depends on the
+# visited area and not on the number of visits. A tile of 64 x 64 cells takes 512 bytes.
+TILE_BITS = 6
+TILE_SIZE = 1 << TILE_BITS
+TILE_MASK = TILE_SIZE - 1
+
+
+class TiledBitmap:
+    tiles: Dict[int, bytearray]  # packed tile coordinates to the bits of the tile, row by row
+
+    def __init__(self):
+        self.tiles = {}
+
+    def add(self, x: int, y: int):
+        key = pack_unbounded(x >> TILE_BITS, y >> TILE_BITS)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = self.tiles[key] = bytearray(TILE_SIZE * TILE_SIZE // 8)
+        bit = (y & TILE_MASK) << TILE_BITS | (x & TILE_MASK)
+        tile[bit >> 3] |= 1 << (bit & 7)
+
+    def __contains__(self, position: Tuple[int, int]) -> bool:
+        x, y = position
+        tile = self.tiles.get(pack_unbounded(x >> TILE_BITS, y >> TILE_BITS))
+        if tile is None:
+            return False
+        bit = (y & TILE_MASK) << TILE_BITS | (x & TILE_MASK)
+        return tile[bit >> 3] >> (bit & 7) & 1 == 1
+
+    def __len__(self) -> int:
+        return sum(int.from_bytes(tile, "little").bit_count() for tile in self.tiles.values())
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        # row by row within a tile, the tiles in insertion order
+        for key, tile in self.tiles.items():
+            tile_x, tile_y = unpack_unbounded(key)
+            bits = int.from_bytes(tile, "little")
+            while bits:
+                bit = (bits & -bits).bit_length() - 1
+                yield tile_x << TILE_BITS | bit & TILE_MASK, tile_y << TILE_BITS | bit >> TILE_BITS
+                bits &= bits - 1
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
+
+from util.file_util import InputSource, STDIN_SOURCE, get_input_source
+
+T = TypeVar("T")
+
+CACHE_DIRECTORY = Path(os.environ.get("AOC_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"))
+CACHE_MAX_BYTES = int(os.environ.get("AOC_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+CACHE_ENABLED = os.environ.get("AOC_CACHE", "1") != "0"
+CACHE_SUFFIX = ".pickle"
+
+
+def get_source_digest(source: InputSource) -> str | None:
+    if source == STDIN_SOURCE:  # a pipe can only be read once
+        return None
+
+    digest = hashlib.sha256()
+    with open(source, "rb") as input_file:
+        for chunk in iter(lambda: input_file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_lines_digest(lines: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def get_cache_path(name: str, module: str, version: int, digest: str) -> Path:
+    key = hashlib.sha256(f"{module}:{name}:{version}:{digest}".encode()).hexdigest()
+    return CACHE_DIRECTORY / f"{key}{CACHE_SUFFIX}"
+
+
+def cached(name: str, get_digest: Callable[[], str | None], version: int, build: Callable[[], T]) -> T:
+    # The module is part of the key, classes pickled from __main__ can't be loaded anywhere else.
+    # The digest is only computed once the cache is known to be enabled, hashing a big input is not free.
+    if not CACHE_ENABLED:
+        return build()
+    digest = get_digest()
+    if digest is None:
+        return build()
+
+    path = get_cache_path(name, build.__module__, version, digest)
+    try:
+        with open(path, "rb") as cache_file:
+            value = pickle.load(cache_file)
+        os.utime(path)  # mark as recently used
+        return value
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        path.unlink(missing_ok=True)
+
+    value = build()
+    store(path, value)
+    evict(CACHE_MAX_BYTES)
+    return value
+
+
+def cached_parse(level_id: int, name: str, version: int, parse: Callable[[], T]) -> T:
+    return cached(name, lambda: get_source_digest(get_input_source(level_id)), version, parse)
+
+
+def store(path: Path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "wb") as cache_file:
+        pickle.dump(value, cache_file, pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def evict(max_bytes: int):
+    entries = []
+    for path in CACHE_DIRECTORY.glob(f"*{CACHE_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # removed by a concurrent run
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(entry[1] for entry in entries)
+    entries.sort()
+    for _, size, path in entries:
+        if total_bytes <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total_bytes -= size
+
+
+def clear_cache():
+    evict(0)
@@ -0,0 +1,79 @@
+from math import isqrt
+from typing import List, Tuple
+
+# A position packs into one int as x + y * stride (+ z * stride^2). x (and y in 3D) have to stay within
+# -stride / 2 .. stride / 2 - 1, pack raises ValueError otherwise, and get_stride picks a stride for a known
+# extent. The outermost coordinate is unbounded. Packing is linear, so adding a packed offset moves the position.
+# Small strides keep the keys of nearby positions in a single int digit, which hashes and adds fastest.
+# pack_unbounded takes any coordinates, but is not linear.
+STRIDE = 1 << 20
+STRIDE_3D = 1 << 20
+
+NEIGHBOURS_4: List[Tuple[int, int]] = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+NEIGHBOURS_8: List[Tuple[int, int]] = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+NEIGHBOURS_6: List[Tuple[int, int, int]] = [(-1, 0, 0), (1, 0, 0), (0, -1, 0), (0, 1, 0), (0, 0, -1), (0, 0, 1)]
+
+
+def get_stride(extent: int) -> int:
+    # the smallest power of two stride that packs every inner coordinate between -extent and extent
+    return 1 << (2 * extent).bit_length()
+
+
+def check_range(value: int, stride: int):
+    half = stride // 2
+    if not -half <= value < stride - half:
+        raise ValueError(f"Coordinate {value} does not fit a stride of {stride}")
+
+
+def pack(x: int, y: int, stride: int = STRIDE) -> int:
+    check_range(x, stride)
+    return y * stride + x
+
+
+def unpack(key: int, stride: int = STRIDE) -> Tuple[int, int]:
+    half = stride // 2
+    y, x = divmod(key + half, stride)
+    return x - half, y
+
+
+def pack3(x: int, y: int, z: int, stride: int = STRIDE_3D) -> int:
+    check_range(x, stride)
+    check_range(y, stride)
+    return (z * stride + y) * stride + x
+
+
+def unpack3(key: int, stride: int = STRIDE_3D) -> Tuple[int, int, int]:
+    x, rest = unpack(key, stride)
+    y, z = unpack(rest, stride)
+    return x, y, z
+
+
+def get_offsets(deltas: List[Tuple[int, int]], stride: int = STRIDE) -> List[int]:
+    return [pack(x, y, stride) for x, y in deltas]
+
+
+def get_offsets3(deltas: List[Tuple[int, int, int]], stride: int = STRIDE_3D) -> List[int]:
+    return [pack3(x, y, z, stride) for x, y, z in deltas]
+
+
+def zigzag(value: int) -> int:
+    # 0, -1, 1, -2, 2, ... to 0, 1, 2, 3, 4, ...
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unzigzag(value: int) -> int:
+    return -((value + 1) >> 1) if value & 1 else value >> 1
+
+
+def pack_unbounded(x: int, y: int) -> int:
+    # Szudzik's pairing of the zigzag encoded coordinates, every pair of ints gets its own key
+    a, b = zigzag(x), zigzag(y)
+    return a * a + a + b if a >= b else b * b + a
+
+
+def unpack_unbounded(key: int) -> Tuple[int, int]:
+    root = isqrt(key)
+    rest = key - root * root
+    if rest < root:
+        return unzigzag(rest), unzigzag(root)
+    return unzigzag(root), unzigzag(rest - root)
@@ -1,18 +1,212 @@
+import gzip
+import io
+import lzma
+import mmap
+import os
+import shutil
 import sys
-from typing import List
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, IO, Iterator, List
 
+InputSource = str | Path
 
-def read_input_file(level_id: int, strip: bool = True) -> List[str]:
-    file_id = 1
-    if "pytest" in sys.modules:
-        file_id = 0
+STDIN_SOURCE = "-"
+INPUT_DIRECTORY = Path(os.environ.get("AOC_INPUT_DIR", Path(__file__).resolve().parent.parent / "input-files"))
+COMPRESSED_SUFFIXES = [".gz", ".xz", ".zst"]
+
+input_sources: Dict[int, InputSource] = {}
+
+
+def get_file_id() -> int:
+    # 1 is the real input, the tests switch to the examples with AOC_INPUT_FILE_ID=0. It is read on every call,
+    # so a change reaches every worker process and both import paths of this module.
+    return int(os.environ.get("AOC_INPUT_FILE_ID", "1"))
+
+
+def set_file_id(file_id: int):
+    os.environ["AOC_INPUT_FILE_ID"] = str(file_id)
+
+
+def set_input_source(level_id: int, source: InputSource):
+    input_sources[level_id] = source
+
+
+def clear_input_sources():
+    input_sources.clear()
+
+
+def get_input_file_path(level_id: int, file_id: int) -> Path:
+    path = INPUT_DIRECTORY / f"level{level_id}-{file_id}.txt"
+    if not path.exists():
+        for suffix in COMPRESSED_SUFFIXES:
+            compressed_path = path.with_name(path.name + suffix)
+            if compressed_path.exists():
+                return compressed_path
+    return path
+
+
+def get_input_source(level_id: int) -> InputSource:
+    if level_id in input_sources:
+        return input_sources[level_id]
+    return get_input_file_path(level_id, get_file_id())
+
+
+def is_plain_file(source: InputSource) -> bool:
+    return source != STDIN_SOURCE and Path(source).suffix not in COMPRESSED_SUFFIXES
+
+
+@contextmanager
+def open_input_source(source: InputSource, binary: bool = False) -> Iterator[IO]:
+    # Compressed sources are decompressed while reading, they are never expanded as a whole
+    if source == STDIN_SOURCE:
+        yield sys.stdin.buffer if binary else sys.stdin
+        return
+
+    suffix = Path(source).suffix
+    if suffix == ".gz":
+        input_file = gzip.open(source, "rb" if binary else "rt")
+    elif suffix == ".xz":
+        input_file = lzma.open(source, "rb" if binary else "rt")
+    elif suffix == ".zst":
+        input_file = open_zstd(source, binary)
+    else:
+        input_file = open(source, "rb" if binary else "r")
+
+    with input_file:
+        yield input_file
+
+
+def open_zstd(source: InputSource, binary: bool) -> IO:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(f"Reading {source} requires the zstandard package") from None
+
+    reader = zstandard.ZstdDecompressor().stream_reader(open(source, "rb"), closefd=True)
+    return reader if binary else io.TextIOWrapper(reader)
+
+
+@contextmanager
+def open_output_file(path: InputSource) -> Iterator[IO]:
+    # Compressed files are compressed while writing, so large outputs never sit in memory
+    suffix = Path(path).suffix
+    if suffix == ".gz":
+        output_file = gzip.open(path, "wt")
+    elif suffix == ".xz":
+        output_file = lzma.open(path, "wt")
+    elif suffix == ".zst":
+        output_file = open_zstd_output(path)
+    else:
+        output_file = open(path, "w", buffering=1 << 20)
+
+    with output_file:
+        yield output_file
+
+
+def open_zstd_output(path: InputSource) -> IO:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(f"Writing {path} requires the zstandard package") from None
 
-    return read_input_file_id(level_id, file_id, strip)
+    writer = zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+    return io.TextIOWrapper(writer)
+
+
+def read_input_file(level_id: int, strip: bool = True) -> List[str]:
+    return list(iterate_input_source(get_input_source(level_id), strip))
 
 
 def read_input_file_id(level_id: int, file_id: int, strip: bool = True) -> List[str]:
-    input_file = open(f"../input-files/level{level_id}-{file_id}.txt", "r")
-    lines = input_file.readlines()
-    if strip:
-        lines = [line.strip() for line in lines]
-    return lines
+    return list(iterate_input_file_id(level_id, file_id, strip))
+
+
+def iterate_input_file(level_id: int, strip: bool = True) -> Iterator[str]:
+    return iterate_input_source(get_input_source(level_id), strip)
+
+
+def iterate_input_file_id(level_id: int, file_id: int, strip: bool = True) -> Iterator[str]:
+    return iterate_input_source(get_input_file_path(level_id, file_id), strip)
+
+
+def iterate_input_source(source: InputSource, strip: bool = True) -> Iterator[str]:
+    # The file is closed as soon as the generator is exhausted or closed
+    with open_input_source(source) as input_file:
+        for line in input_file:
+            yield line.strip() if strip else line
+
+
+def iterate_input_file_chunks(level_id: int, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    return iterate_input_source_chunks(get_input_source(level_id), chunk_size)
+
+
+def iterate_input_source_chunks(source: InputSource, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    # raw bytes in pieces of at most chunk_size, for inputs that are one huge line
+    with open_input_source(source, True) as input_file:
+        while chunk := input_file.read(chunk_size):
+            yield chunk
+
+
+@contextmanager
+def map_input_file(level_id: int) -> Iterator[bytes]:
+    with map_input_source(get_input_source(level_id)) as buffer:
+        yield buffer
+
+
+@contextmanager
+def map_input_file_id(level_id: int, file_id: int) -> Iterator[bytes]:
+    with map_input_source(get_input_file_path(level_id, file_id)) as buffer:
+        yield buffer
+
+
+@contextmanager
+def map_or_stream_input_file(level_id: int, chunk_size: int = 1 << 22) -> Iterator[bytes | Iterator[bytes]]:
+    with map_or_stream_input_source(get_input_source(level_id), chunk_size) as buffer:
+        yield buffer
+
+
+@contextmanager
+def map_or_stream_input_source(source: InputSource, chunk_size: int = 1 << 22) -> Iterator[bytes | Iterator[bytes]]:
+    # Plain files are mapped, pipes and compressed files come as a stream of byte pieces instead of being read
+    # as a whole, for consumers like numpy_util.iterate_chunks that take either
+    if is_plain_file(source):
+        with map_input_source(source) as buffer:
+            yield buffer
+        return
+
+    chunks = iterate_input_source_chunks(source, chunk_size)
+    try:
+        yield chunks
+    finally:
+        chunks.close()
+
+
+@contextmanager
+def map_input_source(source: InputSource) -> Iterator[bytes]:
+    # Pipes and compressed files cannot be mapped. Their decompressed content is spooled into a temporary file that
+    # is mapped instead, so it never has to fit in memory. map_or_stream_input_source skips that copy.
+    if not is_plain_file(source):
+        with tempfile.TemporaryFile() as spool_file:
+            with open_input_source(source, True) as input_file:
+                shutil.copyfileobj(input_file, spool_file, 1 << 20)
+            spool_file.flush()
+            with map_open_file(spool_file) as buffer:
+                yield buffer
+        return
+
+    with open(source, "rb") as input_file:
+        with map_open_file(input_file) as buffer:
+            yield buffer
+
+
+@contextmanager
+def map_open_file(input_file: IO) -> Iterator[bytes]:
+    try:
+        buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # empty files cannot be mapped
+        yield b""
+        return
+    with buffer:
+        yield buffer
@@ -0,0 +1,122 @@
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+Cells = bytearray | array
+
+NEIGHBOURS_4: List[Tuple[int, int]] = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+NEIGHBOURS_8: List[Tuple[int, int]] = NEIGHBOURS_4 + [(1, -1), (1, 1), (-1, 1), (-1, -1)]
+
+DIGITS: Dict[str, int] = {str(digit): digit for digit in range(10)}
+
+
+class Grid:
+    # One byte per cell by default, any other array typecode stores bigger numbers
+    width: int
+    height: int
+    typecode: str
+    cells: Cells
+
+    def __init__(self, width: int, height: int, fill: int = 0, typecode: str = "B", cells: Cells | None = None):
+        self.width = width
+        self.height = height
+        self.typecode = typecode
+        if cells is not None:
+            if len(cells) != width * height:
+                raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+            self.cells = cells
+        elif typecode == "B":
+            self.cells = bytearray([fill]) * (width * height)
+        else:
+            self.cells = array(typecode, [fill]) * (width * height)
+
+    @classmethod
+    def from_lines(cls, lines: List[str], mapping: Dict[str, int] | None = None, fill: int = 0):
+        # Characters without mapping keep their code, short lines are padded with fill
+        table = bytearray(range(256))
+        for char, value in (mapping or {}).items():
+            table[ord(char)] = value
+
+        width = max(map(len, lines), default=0)
+        cells = bytearray()
+        for line in lines:
+            encoded = line.encode()
+            cells += encoded.translate(table)
+            cells += bytes([fill]) * (width - len(encoded))
+        return cls(width, len(lines), cells=cells)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coordinates(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, position: Tuple[int, int]) -> int:
+        x, y = position
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        raise IndexError(f"Position x={x}, y={y} is outside of the grid")
+
+    def __setitem__(self, position: Tuple[int, int], value: int):
+        x, y = position
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.cells[y * self.width + x] = value
+        else:
+            raise IndexError(f"Position x={x}, y={y} is outside of the grid")
+
+    def get(self, x: int, y: int, default: int) -> int:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        return default
+
+    def neighbours(self, x: int, y: int, diagonal: bool = False) -> Iterator[Tuple[int, int]]:
+        for step_x, step_y in NEIGHBOURS_8 if diagonal else NEIGHBOURS_4:
+            neighbour_x, neighbour_y = x + step_x, y + step_y
+            if 0 <= neighbour_x < self.width and 0 <= neighbour_y < self.height:
+                yield neighbour_x, neighbour_y
+
+    def neighbour_indices(self, index: int) -> Iterator[int]:
+        x = index % self.width
+        if x > 0:
+            yield index - 1
+        if x < self.width - 1:
+            yield index + 1
+        if index >= self.width:
+            yield index - self.width
+        if index < len(self.cells) - self.width:
+            yield index + self.width
+
+    def row(self, y: int) -> Cells:
+        return self.cells[y * self.width:(y + 1) * self.width]
+
+    def column(self, x: int) -> Cells:
+        return self.cells[x::self.width]
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def find(self, value: int) -> Tuple[int, int]:
+        return self.coordinates(self.cells.index(value))
+
+    def pad(self, amount: int, fill: int = 0):
+        padded = Grid(self.width + 2 * amount, self.height + 2 * amount, fill, self.typecode)
+        for y in range(self.height):
+            start = padded.index(amount, y + amount)
+            padded.cells[start:start + self.width] = self.row(y)
+        return padded
+
+    def copy(self):
+        return Grid(self.width, self.height, typecode=self.typecode, cells=self.cells[:])
+
+    def to_lines(self, mapping: Dict[int, str] | None = None) -> List[str]:
+        mapping = mapping or {}
+        return ["".join(mapping.get(value, chr(value)) for value in self.row(y)) for y in range(self.height)]
+
+    def to_numpy(self):
+        # a view on the cells, changes to the array show up in the grid
+        import numpy
+
+        return numpy.frombuffer(self.cells, dtype=numpy.dtype(self.typecode)).reshape(self.height, self.width)
@@ -0,0 +1,146 @@
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Everything below returns right away while this is False
+ENABLED = os.environ.get("AOC_INSTRUMENT", "0") != "0"
+PROFILE_MODE = os.environ.get("AOC_PROFILE", "")
+PROGRESS_INTERVAL = float(os.environ.get("AOC_PROGRESS_INTERVAL", 1.0))
+
+timings: Dict[str, float] = defaultdict(float)
+counters: Dict[str, int] = defaultdict(int)
+last_progress: Dict[str, float] = {}
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    timings.clear()
+    counters.clear()
+    last_progress.clear()
+
+
+class Timer:
+    name: str
+    start_time: float
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start_time = 0.0
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        timings[self.name] += time.perf_counter() - self.start_time
+
+
+class NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+def timer(name: str) -> Timer | NullTimer:
+    return Timer(name) if ENABLED else NULL_TIMER
+
+
+def timed(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorate(function: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) -> T:
+            if not ENABLED:
+                return function(*args, **kwargs)
+            with Timer(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def count(name: str, amount: int = 1):
+    if ENABLED:
+        counters[name] += amount
+
+
+def progress(name: str, value: int, total: int | None = None):
+    # samples by time, so calling this in every iteration prints at most once per interval
+    if not ENABLED:
+        return
+    now = time.perf_counter()
+    if now - last_progress.get(name, 0.0) < PROGRESS_INTERVAL:
+        return
+    last_progress[name] = now
+    if total:
+        print(f"[{name}] {value}/{total} ({value * 100 / total:.1f}%)", file=sys.stderr, flush=True)
+    else:
+        print(f"[{name}] {value}", file=sys.stderr, flush=True)
+
+
+def log(name: str, message: str):
+    if ENABLED:
+        print(f"[{name}] {message}", file=sys.stderr, flush=True)
+
+
+@contextmanager
+def profile(name: str, mode: str | None = None) -> Iterator[None]:
+    # mode "cpu" runs cProfile, "memory" tracks allocations with tracemalloc
+    mode = PROFILE_MODE if mode is None else mode
+    if mode == "cpu":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            print(f"[{name}] cpu profile", file=sys.stderr)
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(20)
+    elif mode == "memory":
+        tracemalloc.start()
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            counters[f"{name}.peak_traced_bytes"] = peak
+            print(f"[{name}] memory profile, peak {peak} bytes", file=sys.stderr)
+            for statistic in snapshot.statistics("lineno")[:10]:
+                print(f"  {statistic}", file=sys.stderr)
+    elif mode == "":
+        yield
+    else:
+        raise ValueError(f"Unknown profile mode {mode}")
+
+
+def report():
+    if not ENABLED:
+        return
+    for name, elapsed in sorted(timings.items()):
+        print(f"[timer] {name}: {elapsed:.4f}s", file=sys.stderr)
+    for name, value in sorted(counters.items()):
+        print(f"[counter] {name}: {value}", file=sys.stderr)
@@ -0,0 +1,76 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Tuple
+
+Interval = Tuple[int, int, int]  # start, end (both inclusive), id
+
+
+class IntervalNode:
+    center: int
+    # the intervals containing center, once by ascending start and once by descending end
+    starts: List[int]
+    start_ids: List[int]
+    negative_ends: List[int]
+    end_ids: List[int]
+    left: "IntervalNode | None"  # intervals that end before center
+    right: "IntervalNode | None"  # intervals that start after center
+
+    def __init__(self, intervals: List[Interval]):
+        endpoints = sorted(point for start, end, _ in intervals for point in (start, end))
+        self.center = endpoints[len(endpoints) // 2]
+        left, right, centered = [], [], []
+        for interval in intervals:
+            if interval[1] < self.center:
+                left.append(interval)
+            elif interval[0] > self.center:
+                right.append(interval)
+            else:
+                centered.append(interval)
+        centered.sort()
+        self.starts = [start for start, _, _ in centered]
+        self.start_ids = [interval_id for _, _, interval_id in centered]
+        centered.sort(key=lambda interval: -interval[1])
+        self.negative_ends = [-end for _, end, _ in centered]
+        self.end_ids = [interval_id for _, _, interval_id in centered]
+        self.left = IntervalNode(left) if left else None
+        self.right = IntervalNode(right) if right else None
+
+
+class IntervalTree:
+    # centered interval tree, stabbing queries take O(log n + k)
+    root: IntervalNode | None
+    starts: List[int]  # every start in ascending order, for the range queries
+    start_ids: List[int]
+
+    def __init__(self, intervals: Iterable[Interval]):
+        intervals = list(intervals)
+        for start, end, _ in intervals:
+            if start > end:
+                raise ValueError(f"Interval {start}-{end} ends before it starts")
+        self.root = IntervalNode(intervals) if intervals else None
+        ordered = sorted(intervals)
+        self.starts = [start for start, _, _ in ordered]
+        self.start_ids = [interval_id for _, _, interval_id in ordered]
+
+    def stab(self, point: int) -> List[int]:
+        # the ids of all intervals containing point
+        result = []
+        node = self.root
+        while node is not None:
+            if point < node.center:
+                result += node.start_ids[:bisect_right(node.starts, point)]
+                node = node.left
+            elif point > node.center:
+                result += node.end_ids[:bisect_right(node.negative_ends, -point)]
+                node = node.right
+            else:
+                result += node.start_ids
+                break
+        return result
+
+    def overlap(self, start: int, end: int) -> List[int]:
+        # intervals overlapping start-end either contain start or start within (start, end]
+        if start > end:
+            raise ValueError(f"Range {start}-{end} ends before it starts")
+        first = bisect_right(self.starts, start)
+        last = bisect_left(self.starts, end + 1)
+        return self.stab(start) + self.start_ids[first:last]
@@ -0,0 +1,102 @@
+import mmap
+from typing import Iterable, Iterator, Tuple
+
+# numpy is imported inside the functions, so the levels that do not use it keep working without it
+CHUNK_SIZE = 1 << 22
+MAX_DIGITS = 18  # more digits could overflow int64
+
+
+def iterate_chunks(buffer: bytes | Iterable[bytes], chunk_size: int = CHUNK_SIZE) -> Iterator["ndarray"]:
+    # uint8 views on the buffer, every chunk but the last ends with a line break. Instead of a buffer this takes
+    # a stream of byte pieces as well, like a compressed file that is decompressed while reading.
+    import numpy
+
+    if not isinstance(buffer, (bytes, bytearray, memoryview, mmap.mmap)):
+        yield from iterate_stream_chunks(buffer)
+        return
+
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            end = buffer.rfind(b"\n", start, end) + 1
+            if end <= start:  # a single line longer than the chunk
+                end = buffer.find(b"\n", start + chunk_size) + 1 or size
+        yield numpy.frombuffer(buffer, numpy.uint8, end - start, start)
+        start = end
+
+
+def iterate_stream_chunks(pieces: Iterable[bytes]) -> Iterator["ndarray"]:
+    # a chunk per piece, the partial last line of a piece is carried over into the next chunk
+    import numpy
+
+    rest = b""
+    for piece in pieces:
+        data = rest + piece
+        end = data.rfind(b"\n") + 1
+        if end > 0:
+            yield numpy.frombuffer(data, numpy.uint8, end)
+        rest = data[end:]
+    if rest:
+        yield numpy.frombuffer(rest, numpy.uint8)
+
+
+def get_line_starts(chunk: "ndarray") -> "ndarray":
+    # blank lines are skipped
+    import numpy
+
+    starts = numpy.concatenate(([0], numpy.flatnonzero(chunk == ord("\n")) + 1))
+    starts = starts[starts < len(chunk)]
+    return starts[(chunk[starts] != ord("\n")) & (chunk[starts] != ord("\r"))]
+
+
+def iterate_line_integers(
+    buffer: bytes | Iterable[bytes], chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple["ndarray", "ndarray"]]:
+    # yields (values, blank) arrays with one entry per line
+    for chunk in iterate_chunks(buffer, chunk_size):
+        yield parse_line_integers(chunk)
+
+
+def parse_line_integers(chunk: "ndarray") -> Tuple["ndarray", "ndarray"]:
+    # every line holds an unsigned integer or nothing, "\r\n" line breaks are fine
+    import numpy
+
+    line_ends = numpy.flatnonzero(chunk == ord("\n"))
+    if len(chunk) > 0 and chunk[-1] != ord("\n"):
+        line_ends = numpy.append(line_ends, len(chunk))
+    line_starts = numpy.zeros_like(line_ends)
+    line_starts[1:] = line_ends[:-1] + 1
+    line_ends -= (line_ends > line_starts) & (chunk[line_ends - 1] == ord("\r"))
+    lengths = line_ends - line_starts
+    return parse_digits(chunk, line_starts, line_ends), lengths == 0
+
+
+def parse_integer_runs(chunk: "ndarray") -> "ndarray":
+    # every maximal run of digits is one unsigned integer, anything else separates them
+    import numpy
+
+    is_digit = (chunk - numpy.uint8(ord("0"))) <= 9
+    changes = numpy.flatnonzero(numpy.diff(is_digit, prepend=False, append=False))
+    return parse_digits(chunk, changes[::2], changes[1::2])
+
+
+def parse_digits(chunk: "ndarray", starts: "ndarray", ends: "ndarray") -> "ndarray":
+    import numpy
+
+    width = int((ends - starts).max(initial=0))
+    if width > MAX_DIGITS:
+        raise ValueError(f"Cannot parse numbers with {width} digits")
+
+    # Horner's scheme over right aligned digit columns, positions before the start count as 0
+    values = numpy.zeros(len(ends), dtype=numpy.int64)
+    for offset in range(width, 0, -1):
+        positions = ends - offset
+        digits = chunk[numpy.maximum(positions, 0)] - numpy.uint8(ord("0"))
+        digits[positions < starts] = 0
+        if (digits > 9).any():  # anything below "0" wrapped around
+            raise ValueError("Found a number with other characters than digits")
+        values *= 10
+        values += digits
+    return values
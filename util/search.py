@@ -0,0 +1,146 @@
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from typing import Callable, Iterable, List, Tuple
+
+# Nodes are the integers 0 .. num_nodes - 1, so all bookkeeping lives in flat arrays instead of dicts and sets
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[Tuple[int, int]]]
+
+UNREACHED = -1
+
+
+class SearchResult:
+    distances: array
+    predecessors: array | None  # None if the search did not track paths
+    target: int | None  # the first node that satisfied is_target
+
+    def __init__(self, distances: array, predecessors: array | None, target: int | None):
+        self.distances = distances
+        self.predecessors = predecessors
+        self.target = target
+
+    def distance(self, node: int) -> int:
+        return self.distances[node]
+
+    def path(self, node: int) -> List[int]:
+        # the nodes after the source up to and including node, empty if node was not reached
+        if self.predecessors is None:
+            raise ValueError("The search did not track paths")
+        if self.distances[node] == UNREACHED:
+            return []
+        path = []
+        while self.predecessors[node] != UNREACHED:
+            path.append(node)
+            node = self.predecessors[node]
+        path.reverse()
+        return path
+
+
+def bfs(
+    sources: Iterable[int],
+    neighbours: Neighbours,
+    num_nodes: int,
+    is_target: Callable[[int], bool] | None = None,
+    track_paths: bool = True,
+) -> SearchResult:
+    # without track_paths only the distances are kept, which halves the memory
+    distances = array("i", [UNREACHED]) * num_nodes
+    predecessors = array("i", [UNREACHED]) * num_nodes if track_paths else None
+    frontier = deque()
+    for source in sources:
+        if distances[source] == UNREACHED:
+            distances[source] = 0
+            frontier.append(source)
+
+    while frontier:
+        node = frontier.popleft()
+        if is_target is not None and is_target(node):
+            return SearchResult(distances, predecessors, node)
+        next_distance = distances[node] + 1
+        for neighbour in neighbours(node):
+            if distances[neighbour] == UNREACHED:
+                distances[neighbour] = next_distance
+                if predecessors is not None:
+                    predecessors[neighbour] = node
+                frontier.append(neighbour)
+    return SearchResult(distances, predecessors, None)
+
+
+def dijkstra(
+    sources: Iterable[int],
+    neighbours: WeightedNeighbours,
+    num_nodes: int,
+    is_target: Callable[[int], bool] | None = None,
+    heuristic: Callable[[int], int] | None = None,
+) -> SearchResult:
+    # with an admissible heuristic this is A*
+    distances = array("q", [UNREACHED]) * num_nodes
+    predecessors = array("i", [UNREACHED]) * num_nodes
+    closed = bytearray(num_nodes)
+    frontier: List[Tuple[int, int]] = []
+    for source in sources:
+        distances[source] = 0
+        heappush(frontier, (heuristic(source) if heuristic else 0, source))
+
+    while frontier:
+        _, node = heappop(frontier)
+        if closed[node]:
+            continue
+        closed[node] = 1
+        if is_target is not None and is_target(node):
+            return SearchResult(distances, predecessors, node)
+        for neighbour, cost in neighbours(node):
+            distance = distances[node] + cost
+            if not closed[neighbour] and (distances[neighbour] == UNREACHED or distance < distances[neighbour]):
+                distances[neighbour] = distance
+                predecessors[neighbour] = node
+                heappush(frontier, (distance + heuristic(neighbour) if heuristic else distance, neighbour))
+    return SearchResult(distances, predecessors, None)
+
+
+def layered_grid_search(
+    width: int,
+    height: int,
+    entries: Iterable[Tuple[int, int]],
+    target: Tuple[int, int],
+    get_blocked_row: Callable[[int, int], int],
+    period: int,
+    first_layer: int = 0,
+) -> int:
+    # A BFS through time on a width x height grid whose blocked cells change from layer to layer and repeat after
+    # period layers. Every layer a walker steps to a 4-neighbour or stays, and it can enter at an entry cell at any
+    # layer after first_layer. get_blocked_row(y, layer) is the bitmask of the blocked cells in row y, bit x for
+    # column x. The frontier is one such bitmask per row, so a layer costs a few int operations per row and no
+    # distances are stored. Returns the first layer at which the target is reached.
+    full_row = (1 << width) - 1
+    entry_rows = [0] * height
+    for x, y in entries:
+        entry_rows[y] |= 1 << x
+    target_x, target_y = target
+    layer = first_layer
+    frontier = [0] * height
+    earlier_frontier = None
+    while not frontier[target_y] >> target_x & 1:
+        if (layer - first_layer) % period == 0:
+            # one period later every path can be taken again, so the frontier only grows from period to period,
+            # and once it stops growing the target is out of reach
+            if frontier == earlier_frontier:
+                raise ValueError(f"Cannot reach {target}")
+            earlier_frontier = frontier
+        layer += 1
+        next_frontier = []
+        for y in range(height):
+            row = frontier[y]
+            reached = row | row << 1 | row >> 1 | entry_rows[y]
+            if y > 0:
+                reached |= frontier[y - 1]
+            if y < height - 1:
+                reached |= frontier[y + 1]
+            next_frontier.append(reached & full_row & ~get_blocked_row(y, layer))
+        frontier = next_frontier
+    return layer
+
+
+def all_pairs(num_nodes: int, neighbours: Neighbours) -> List[SearchResult]:
+    return [bfs([source], neighbours, num_nodes) for source in range(num_nodes)]